@@ -1,12 +1,21 @@
 """Standard animation class"""
 
+import math
 import numbers
+import sys
+import time
 import tkinter
 import typing
 import warnings
+import weakref
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from ..color import rgb
-from ..core import virtual
+from ..core import constants, virtual
 from . import controllers
 
 __all__ = [
@@ -17,10 +26,183 @@ __all__ = [
     "MoveItem",
     "GradientTkWidget",
     "GradientItem",
+    "ColorTransition",
     "ScaleFontSize",
 ]
 
 
+class _GradientBatch:
+    """
+    Colors of the color transitions that are played in a frame
+
+    The colors are interpolated in one pass, over arrays of NumPy if it is
+    installed, and the items of each canvas are configured by one Tcl script.
+    """
+
+    def __init__(self) -> None:
+        self._frames: list[tuple["ColorTransition", float, bool]] = []
+
+    def add(
+        self,
+        transition: "ColorTransition",
+        percentage: float,
+        final: bool,
+    ) -> None:
+        """
+        Add a frame of a color transition
+
+        * `transition`: the color transition
+        * `percentage`: the percentage of the animation progress
+        * `final`: whether it is the last frame of the transition
+        """
+        self._frames.append((transition, percentage, final))
+
+    def _interpolate(self) -> list[rgb.RGB]:
+        """Return the colors of all the frames"""
+        rgbs = [transition._rgbs for transition, _, _ in self._frames]
+        if numpy is None or len(rgbs) < 8:  # NumPy is slower for a few items
+            return [tuple(min(255, max(0, c)) for c in rgb.convert(*pair, p))
+                    for pair, (_, p, _) in zip(rgbs, self._frames)]
+        first, second = numpy.array(rgbs, dtype=float).transpose(1, 0, 2)
+        percentages = numpy.array([p for _, p, _ in self._frames])[:, None]
+        result = first + numpy.rint((second-first) * percentages)
+        return [tuple(c) for c in result.clip(0, 255).astype(int).tolist()]
+
+    def flush(self) -> None:
+        """
+        Configure the items of all the frames
+
+        ATTENTION:
+
+        * If the script of a canvas fails, its transitions are stopped. The
+        error is raised after all the canvases are configured, unless the
+        canvas has been destroyed
+        """
+        if not self._frames:
+            return
+        scripts: dict[tkinter.Canvas, tuple[list[ColorTransition], list[str]]] = {}
+        for (transition, _, final), value in zip(self._frames, self._interpolate()):
+            if final:
+                transition._rgb, color = transition._rgbs[1], transition._target
+            else:
+                transition._rgb, color = value, rgb.rgb_to_str(value)
+            transition._color = color
+            transitions, lines = scripts.setdefault(transition._canvas, ([], []))
+            transitions.append(transition)
+            lines.extend(
+                f"{transition._canvas} itemconfigure {item} " + " ".join(
+                    f"-{parameter} {{{color}}}" for parameter in parameters)
+                for item, parameters in transition._targets.items())
+        self._frames.clear()
+        error = None
+        for canvas, (transitions, lines) in scripts.items():
+            try:
+                canvas.tk.eval("\n".join(lines))
+            except tkinter.TclError as exc:  # The others still get their frames
+                for transition in transitions:
+                    transition.stop()
+                if error is None and canvas.winfo_exists():
+                    error = exc  # Not just a destroyed canvas
+        if error is not None:
+            raise error
+
+
+class _FrameClock:
+    """
+    Frame clock shared by all animations of a Tcl interpreter
+
+    A single `after` loop plays the frames of all running animations. Frames
+    are timed with a monotonic clock, and the loop stops itself when no
+    animation is running.
+    """
+
+    def __init__(self, root: tkinter.Misc) -> None:
+        """
+        * `root`: the root window of the Tcl interpreter
+        """
+        self._root = weakref.ref(root)
+        self._animations: list[Animation] = []
+        self._task: str | None = None
+        self._due: float = math.inf
+        self._batch = _GradientBatch()
+
+    @staticmethod
+    def get() -> "_FrameClock":
+        """Return the clock of the default root window"""
+        root = tkinter._default_root
+        if (clock := _clocks.get(root)) is None:
+            clock = _clocks[root] = _FrameClock(root)
+        return clock
+
+    def add(self, animation: "Animation") -> None:
+        """
+        Let the clock play the frames of an animation
+
+        * `animation`: the animation
+        """
+        if animation not in self._animations:
+            self._animations.append(animation)
+        self._schedule()
+
+    def remove(self, animation: "Animation") -> None:
+        """
+        Stop playing the frames of an animation
+
+        * `animation`: the animation
+        """
+        if animation in self._animations:
+            self._animations.remove(animation)
+        if not self._animations and self._task is not None:
+            if (root := self._root()) is not None:
+                tkinter.Misc.after_cancel(root, self._task)
+            self._task, self._due = None, math.inf
+
+    def _schedule(self) -> None:
+        """Schedule the next tick at the time when the earliest frame is due"""
+        root = self._root()
+        due = min((animation._due for animation in self._animations),
+                  default=math.inf)
+        if self._task is not None:
+            if due >= self._due:
+                return
+            if root is not None:
+                tkinter.Misc.after_cancel(root, self._task)
+            self._task = None
+        self._due = due
+        if root is not None and due != math.inf:
+            self._task = tkinter.Misc.after(
+                root, max(0, round((due-time.perf_counter())*1000)), self._tick)
+
+    def _tick(self) -> None:
+        """Play the frames that are due"""
+        self._task, self._due = None, math.inf
+        now = time.perf_counter() + 0.001  # Timers of Tk are not more accurate
+        try:
+            for animation in self._animations.copy():
+                if animation._due <= now:
+                    try:
+                        animation._tick(now)
+                    except Exception:  # Only the failing animation is dropped
+                        animation.stop()
+                        self._report()
+        finally:
+            try:
+                self._batch.flush()
+            finally:
+                self._schedule()
+
+    def _report(self) -> None:
+        """Report the exception that is being handled as Tk does"""
+        if (root := self._root()) is not None:
+            root.report_callback_exception(*sys.exc_info())
+        else:
+            raise
+
+
+_clocks: "weakref.WeakKeyDictionary[tkinter.Misc, _FrameClock]" = \
+    weakref.WeakKeyDictionary()
+
+
 class Animation:
     """Animation base class"""
 
@@ -33,6 +215,7 @@ class Animation:
         end: typing.Callable[[], typing.Any] | None = None,
         repeat: int = 0,
         fps: int = 30,
+        skip: bool = False,
         derivation: bool = False,
     ) -> None:
         """
@@ -44,6 +227,8 @@ class Animation:
         * `end`: ending function, which is called once at the end of the animation
         * `repeat`: number of repetitions of the entire animation process
         * `fps`: the FPS of the animation
+        * `skip`: whether to skip the frames that are late and sample the
+        progress at the real elapsed time
         * `derivation`: whether the callback function is derivative
         """
         self.ms = ms
@@ -53,35 +238,63 @@ class Animation:
         self.repeat = repeat
         self.fps = fps
         self.derivation = derivation
+        self.skip = skip
 
-        self._tasks: list[str] = []
-        self._delay: int = 1000 // fps
+        self._clock: _FrameClock | None = None
+        self._start: float = 0
+        self._frame: int = 0  # number of frames that have been played
+        self._last_percentage: float = 0
+        self._duration: int = ms  # duration under the render policy
+        self._total: int = 1  # number of frames
 
-        if self._delay <= self.ms:
-            self._total, self._leave = divmod(self.ms, self._delay)
-        else:
-            self._delay, self._total, self._leave = self.ms, 1, -1
+    @property
+    def _due(self) -> float:
+        """The time when the next frame is due"""
+        return self._start + self._duration*(self._frame+1) / self._total / 1000
 
-    def _wrapper(
-        self,
-        func: typing.Callable[[float], float],
-    ) -> typing.Callable[[float], float]:
+    def _tick(self, now: float) -> None:
+        """
+        Play the frames that are due
+
+        * `now`: the current time of the frame clock
+        """
+        while self._clock is not None and self._due <= now:
+            self._frame += 1
+            if self.skip:
+                while self._frame < self._total and self._due <= now:
+                    self._frame += 1  # The main loop could not deliver them
+                progress = (now-self._start)*1000 / self._duration \
+                    if self._duration else 1
+            else:
+                progress = self._frame / self._total
+            if self._frame == self._total:
+                self._play(self.controller(1))  # Land exactly on the end
+                self._finish()
+            else:
+                self._play(self.controller(min(progress, 1)))
+
+    def _play(self, percentage: float) -> None:
         """
-        Make the ending function call correctly
+        Call the callback function with the progress of a frame
 
-        * `func`: the callback function to be wrapped
+        * `percentage`: the percentage of the animation progress
         """
-        def wrapper(x: float) -> None:
-            func(x)
+        self.callback(percentage - self._last_percentage)
+        if self.derivation:
+            self._last_percentage = percentage
 
-            if self.end is not None:
-                self.end()
+    def _finish(self) -> None:
+        """Make the ending function call correctly"""
+        self.stop()
 
-            if self.repeat != 0:
-                self.repeat -= 1
-                self.start()
+        if self.end is not None:
+            self.end()
 
-        return wrapper
+        # Finite repeats are kept when animations are instant, since they
+        # change the end state, but infinite ones would never stop
+        if self.repeat > 0 or self.repeat < 0 and constants.MAX_FPS != 0:
+            self.repeat -= 1
+            self.start()
 
     def start(self, *, delay: int = 0) -> None:
         """
@@ -89,27 +302,24 @@ class Animation:
 
         * `delay`: length of the delay before the animation starts, in milliseconds 
         """
-        self._tasks.clear()
-        last_percentage = 0
-
-        for i in range(1, self._total+1):
-            delay += self._delay + (i < self._leave)
-            percentage = self.controller(i/self._total)
-            task = tkinter.Misc.after(
-                tkinter._default_root, delay,
-                self._wrapper(
-                    self.callback) if i == self._total else self.callback,
-                percentage - last_percentage
-            )
-            self._tasks.append(task)
-
-            if self.derivation:
-                last_percentage = percentage
+        self.stop()
+        fps = self.fps if constants.MAX_FPS is None else min(
+            self.fps, constants.MAX_FPS)
+        if fps > 0 and (delay_ := 1000 // fps) <= self.ms:
+            self._duration, self._total = self.ms, self.ms // delay_
+        else:  # The only frame is the last one
+            self._duration, self._total = self.ms if fps > 0 else 0, 1
+        self._start = time.perf_counter() + delay/1000
+        self._frame = 0
+        self._last_percentage = 0
+        self._clock = _FrameClock.get()
+        self._clock.add(self)
 
     def stop(self) -> None:
         """Stop the animation"""
-        for task in self._tasks[::-1]:
-            tkinter.Misc.after_cancel(tkinter._default_root, task)
+        if self._clock is not None:
+            self._clock, clock = None, self._clock
+            clock.remove(self)
 
 
 class MoveTkWidget(Animation):
@@ -125,6 +335,7 @@ class MoveTkWidget(Animation):
         end: typing.Callable[[], typing.Any] | None = None,
         repeat: int = 0,
         fps: int = 30,
+        skip: bool = False,
     ) -> None:
         """
         * `widget`: tkinter widget to be moved
@@ -135,6 +346,8 @@ class MoveTkWidget(Animation):
         * `end`: ending function, which is called once at the end of the animation
         * `repeat`: number of repetitions of the entire animation process
         * `fps`: the FPS of the animation
+        * `skip`: whether to skip the frames that are late and sample the
+        progress at the real elapsed time
         """
         if not widget.place_info():
             warnings.warn(
@@ -146,7 +359,7 @@ class MoveTkWidget(Animation):
         Animation.__init__(
             self, ms, controller,
             callback=lambda p: widget.place(x=x0+dx*p, y=y0+dy*p),
-            end=end, repeat=repeat, fps=fps,
+            end=end, repeat=repeat, fps=fps, skip=skip,
         )
 
 
@@ -163,6 +376,7 @@ class MoveWidget(Animation):
         end: typing.Callable[[], typing.Any] | None = None,
         repeat: int = 0,
         fps: int = 30,
+        skip: bool = False,
     ) -> None:
         """
         * `widget`: widget to be moved
@@ -173,13 +387,15 @@ class MoveWidget(Animation):
         * `end`: ending function, which is called once at the end of the animation
         * `repeat`: number of repetitions of the entire animation process
         * `fps`: the FPS of the animation
+        * `skip`: whether to skip the frames that are late and sample the
+        progress at the real elapsed time
         """
         dx, dy = offset
 
         Animation.__init__(
             self, ms, controller,
             callback=lambda p: widget.move(dx*p, dy*p),
-            end=end, repeat=repeat, fps=fps, derivation=True,
+            end=end, repeat=repeat, fps=fps, skip=skip, derivation=True,
         )
 
 
@@ -196,6 +412,7 @@ class MoveComponent(Animation):
         end: typing.Callable[[], typing.Any] | None = None,
         repeat: int = 0,
         fps: int = 30,
+        skip: bool = False,
     ) -> None:
         """
         * `component`: component to be moved
@@ -206,13 +423,15 @@ class MoveComponent(Animation):
         * `end`: ending function, which is called once at the end of the animation
         * `repeat`: number of repetitions of the entire animation process
         * `fps`: the FPS of the animation
+        * `skip`: whether to skip the frames that are late and sample the
+        progress at the real elapsed time
         """
         dx, dy = offset
 
         Animation.__init__(
             self, ms, controller,
             callback=lambda p: component.move(dx*p, dy*p),
-            end=end, repeat=repeat, fps=fps, derivation=True,
+            end=end, repeat=repeat, fps=fps, skip=skip, derivation=True,
         )
 
 
@@ -230,6 +449,7 @@ class MoveItem(Animation):
         end: typing.Callable[[], typing.Any] | None = None,
         repeat: int = 0,
         fps: int = 30,
+        skip: bool = False,
     ) -> None:
         """
         * `canvas`: an instance of `tkinter.Canvas` that contains the item
@@ -241,13 +461,15 @@ class MoveItem(Animation):
         * `end`: ending function, which is called once at the end of the animation
         * `repeat`: number of repetitions of the entire animation process
         * `fps`: the FPS of the animation
+        * `skip`: whether to skip the frames that are late and sample the
+        progress at the real elapsed time
         """
         dx, dy = offset
 
         Animation.__init__(
             self, ms, controller,
             callback=lambda p: canvas.move(item, dx*p, dy*p),
-            end=end, repeat=repeat, fps=fps, derivation=True,
+            end=end, repeat=repeat, fps=fps, skip=skip, derivation=True,
         )
 
 
@@ -265,6 +487,7 @@ class GradientTkWidget(Animation):
         end: typing.Callable[[], typing.Any] | None = None,
         repeat: int = 0,
         fps: int = 30,
+        skip: bool = False,
         derivation: bool = False,
     ) -> None:
         """
@@ -278,6 +501,8 @@ class GradientTkWidget(Animation):
         * `end`: ending function, which is called once at the end of the animation
         * `repeat`: number of repetitions of the entire animation process
         * `fps`: the FPS of the animation
+        * `skip`: whether to skip the frames that are late and sample the
+        progress at the real elapsed time
         * `derivation`: whether the callback function is derivative
         """
         if not all(colors):
@@ -289,7 +514,7 @@ class GradientTkWidget(Animation):
             self, ms, controller,
             callback=lambda p: widget.configure(
                 **{parameter: rgb.rgb_to_str(rgb.convert(rgb1, rgb2, p))}),
-            end=end, repeat=repeat, fps=fps, derivation=derivation,
+            end=end, repeat=repeat, fps=fps, skip=skip, derivation=derivation,
         )
 
 
@@ -308,6 +533,7 @@ class GradientItem(Animation):
         end: typing.Callable[[], typing.Any] | None = None,
         repeat: int = 0,
         fps: int = 30,
+        skip: bool = False,
         derivation: bool = False,
     ) -> None:
         """
@@ -322,6 +548,8 @@ class GradientItem(Animation):
         * `end`: ending function, which is called once at the end of the animation
         * `repeat`: number of repetitions of the entire animation process
         * `fps`: the FPS of the animation
+        * `skip`: whether to skip the frames that are late and sample the
+        progress at the real elapsed time
         * `derivation`: whether the callback function is derivative
         """
         if not all(colors):
@@ -333,10 +561,86 @@ class GradientItem(Animation):
             self, ms, controller,
             callback=lambda p: canvas.itemconfigure(
                 item, **{parameter: rgb.rgb_to_str(rgb.convert(rgb1, rgb2, p))}),
-            end=end, repeat=repeat, fps=fps, derivation=derivation,
+            end=end, repeat=repeat, fps=fps, skip=skip, derivation=derivation,
         )
 
 
+class ColorTransition(Animation):
+    """
+    Retargetable animation that makes color of some canvas items gradient
+
+    The current color is kept in Python, so the destination color can be
+    changed while the animation is running, and the gradient continues from
+    the current color without reading it back from the canvas.
+    """
+
+    def __init__(
+        self,
+        canvas: tkinter.Canvas,
+        targets: list[tuple[int, str]],
+        ms: int,
+        *,
+        color: str | None = None,
+        controller: typing.Callable[[float], float] = controllers.flat,
+        fps: int = 30,
+        skip: bool = True,
+    ) -> None:
+        """
+        * `canvas`: an instance of `tkinter.Canvas` that contains the items
+        * `targets`: the items and the parameter names of the parts of them
+        that need to be modified in color
+        * `ms`: duration of the animation, in milliseconds
+        * `color`: the current color of the items, None indicates that it is
+        unknown
+        * `controller`: control functions that determine the course of the
+        entire animation movement
+        * `fps`: the FPS of the animation
+        * `skip`: whether to skip the frames that are late and sample the
+        progress at the real elapsed time
+        """
+        self._canvas = canvas
+        self._targets: dict[int, list[str]] = {}
+        for item, parameter in targets:
+            self._targets.setdefault(item, []).append(parameter)
+        self._color = color  # the color of the items
+        self._target = color  # the destination color
+        self._rgb = rgb.str_to_rgb(color) if color else None
+        self._rgbs: tuple[rgb.RGB, rgb.RGB] | None = None
+
+        Animation.__init__(self, ms, controller, callback=self._step,
+                           fps=fps, skip=skip)
+
+    def _apply(self, color: str) -> None:
+        """Set the color of the items immediately"""
+        self._color = color
+        for item, parameters in self._targets.items():
+            self._canvas.itemconfigure(
+                item, **{parameter: color for parameter in parameters})
+
+    def _step(self, percentage: float) -> None:
+        """Set the color of the items in a frame, together with others"""
+        self._clock._batch.add(self, percentage, self._frame == self._total)
+
+    def retarget(self, color: str, *, no_delay: bool = False) -> None:
+        """
+        Change the destination color
+
+        * `color`: the destination color, an empty string means transparent
+        * `no_delay`: whether to change the color immediately
+        """
+        if color == self._target and self._clock is not None and not no_delay:
+            return  # It is already on the way
+        self._target = color
+        if color == self._color:
+            return self.stop()
+        if no_delay or not color or self._rgb is None or constants.MAX_FPS == 0:
+            self.stop()
+            self._rgb = rgb.str_to_rgb(color) if color else None
+            return self._apply(color)
+        self._rgbs = self._rgb, rgb.str_to_rgb(color)
+        self.start()
+
+
 class ScaleFontSize(Animation):
     """Animation of scaling the font size"""
 
@@ -350,24 +654,28 @@ class ScaleFontSize(Animation):
         end: typing.Callable[[], typing.Any] | None = None,
         repeat: int = 0,
         fps: int = 30,
+        skip: bool = False,
         derivation: bool = False,
     ) -> None:
         """
         * `text`: an instance of `virtual.Text` that needs to be scaled in font size
         * `ms`: duration of the animation, in milliseconds
-        * `sizes`: a tuple of the initial and ending sizes or target font size
+        * `sizes`: a tuple of the initial and ending sizes or target font size,
+        the sizes are the ones before zooming
         * `controller`: control functions that determine the course of the
         entire animation movement
         * `end`: ending function, which is called once at the end of the animation
         * `repeat`: number of repetitions of the entire animation process
         * `fps`: the FPS of the animation
+        * `skip`: whether to skip the frames that are late and sample the
+        progress at the real elapsed time
         * `derivation`: whether the callback function is derivative
         """
         self._text = text
 
         if isinstance(sizes, numbers.Number):
             sizes = -abs(sizes)
-            sizes = text.font.cget("size"), sizes-text.font.cget("size")
+            sizes = text.cget_font("size"), sizes-text.cget_font("size")
         else:
             sizes = -abs(sizes[0]), -abs(sizes[1])
             sizes = sizes[0], sizes[1] - sizes[0]
@@ -375,10 +683,10 @@ class ScaleFontSize(Animation):
         Animation.__init__(
             self, ms, controller,
             callback=lambda p: self._scale(round(sizes[0] + sizes[1]*p)),
-            end=end, repeat=repeat, fps=fps, derivation=derivation,
+            end=end, repeat=repeat, fps=fps, skip=skip, derivation=derivation,
         )
 
     def _scale(self, size: int) -> None:
         """Scale font size"""
-        self._text.font.config(size=size)
+        self._text.configure_font(size=size)
         self._text.update()
@@ -15,14 +15,19 @@ The built-in control functions are:
 * `flat`: speed remains the same
 * `smooth`: speed is slow first, then fast and then slow
 * `rebound`: before the end, displacement will bounce off a bit
+
+Control functions that are expensive to evaluate can be compiled into lookup
+tables by `compile_controller`.
 """
 
 import functools
 import math
 import typing
+import weakref
 
 __all__ = [
     "controller_generator",
+    "compile_controller",
     "flat",
     "smooth",
     "rebound",
@@ -88,18 +93,63 @@ def controller_generator(
     * Before modifying: `y = 2*sin(t)`, `0 <= t <= π/2`
     * After modifying: `y = sin(t*π/2)`, `0 <= t <= 1`
     """
-    if map_y:
-        @functools.wraps(base_function)
-        def _mapper(t: float) -> float:
-            return _map_y(base_function, end)(_map_t(start, end)(t))
-    else:
-        @functools.wraps(base_function)
-        def _mapper(t: float) -> float:
-            return base_function(_map_t(start, end)(t))
+    map_t = _map_t(start, end)
+    function = _map_y(base_function, end) if map_y else base_function
+
+    @functools.wraps(base_function)
+    def _mapper(t: float) -> float:
+        return function(map_t(t))
 
     return _mapper
 
 
+_compiled: "weakref.WeakValueDictionary[tuple[typing.Callable, int], typing.Callable]" = \
+    weakref.WeakValueDictionary()  # compiled control functions that are in use
+
+
+def compile_controller(
+    controller: typing.Callable[[float], float],
+    *,
+    resolution: int = 1024,
+) -> typing.Callable[[float], float]:
+    """
+    Compile a control function into a lookup table with linear interpolation
+
+    The compiled control functions are cached while they are in use, so
+    compiling the same control function with the same resolution returns the
+    same object.
+
+    * `controller`: control function
+    * `resolution`: number of intervals that the lookup table divides 0 ~ 1 into
+
+    ATTENTION:
+
+    The compiled control function gives exact values at 0 and 1, and values
+    outside 0 ~ 1 are calculated by the original control function.
+    """
+    if (source := getattr(controller, "_source", None)) is not None:
+        if controller._resolution == resolution:
+            return controller
+        return compile_controller(source, resolution=resolution)
+    if (compiled := _compiled.get((controller, resolution))) is not None:
+        return compiled
+
+    table = [controller(i/resolution) for i in range(resolution+1)]
+
+    table.append(table[-1])  # So that t = 1 needs no special case
+
+    @functools.wraps(controller)
+    def _lookup(t: float) -> float:
+        if 0 <= t <= 1:
+            index = int(position := t*resolution)
+            return (left := table[index]) + (table[index+1]-left)*(position-index)
+        return controller(t)
+
+    _lookup._source, _lookup._resolution = controller, resolution
+    _compiled[controller, resolution] = _lookup
+    return _lookup
+
+
 def flat(t: float) -> float:
     """Flat animation: speed remains the same"""
     return t
@@ -110,6 +160,9 @@ def smooth(t: float) -> float:
     return (1 - math.cos(t*math.pi)) / 2
 
 
+_rebound = controller_generator(math.sin, 0, math.pi/2 + 0.5)
+
+
 def rebound(t: float) -> float:
     """Rebound animation: before the end, displacement will bounce off a bit"""
-    return controller_generator(math.sin, 0, math.pi/2 + 0.5)(t)
+    return _rebound(t)
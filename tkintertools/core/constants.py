@@ -1,24 +1,35 @@
 """All constants"""
 
 import math
+import os
 import platform
 
 FONT: str = None
 SIZE: int = None
 SYSTEM: str = None
 GOLDEN_RATIO: float = (math.sqrt(5)-1) / 2
+MAX_FPS: int | None = None  # None: unlimited, 0: animations are instant
+IMAGE_CACHE: int = None  # memory budget of the scaled images, in bytes
 
 __all__ = [
     "FONT",
     "SIZE",
     "SYSTEM",
+    "MAX_FPS",
+    "IMAGE_CACHE",
     "reset",
 ]
 
 
+def _is_remote_display() -> bool:
+    """Whether the X server is connected over the network, like X forwarding"""
+    host = os.environ.get("DISPLAY", "").rpartition(":")[0]
+    return bool(host) and host != "unix" and not host.startswith("/")
+
+
 def reset() -> None:
     """Reset all constants to default value"""
-    global FONT, SIZE, SYSTEM
+    global FONT, SIZE, SYSTEM, MAX_FPS, IMAGE_CACHE
     SIZE = -20
     if (SYSTEM := platform.system()) == "Windows":
         # When the Python version is 3.10, the function below gets an error result
@@ -29,6 +40,8 @@ def reset() -> None:
             SYSTEM = "Windows10"
     FONT = "Microsoft YaHei" if SYSTEM.startswith(
         "Windows") else "PingFang SC" if SYSTEM == "Darwin" else "Noto Sans"
+    MAX_FPS = 0 if _is_remote_display() else None
+    IMAGE_CACHE = 64 * 1024 * 1024
 
 
 reset()
@@ -1,6 +1,9 @@
 """All containers"""
 
+import collections
 import functools
+import inspect
+import itertools
 import math
 import platform
 import tkinter
@@ -9,7 +12,7 @@ import typing
 
 from ..style import manager, parser
 from ..toolbox import enhanced, tools
-from . import constants, virtual
+from . import virtual
 
 __all__ = [
     "Tk",
@@ -19,6 +22,18 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _overridden_hooks(feature: type[virtual.Feature]) -> tuple[str, ...]:
+    """
+    Return the names of the hooks that the class of feature overrides
+
+    * `feature`: the class of feature
+    """
+    return tuple(name for name, hook in vars(virtual.Feature).items()
+                 if inspect.isfunction(hook) and not name.startswith("__")
+                 and getattr(feature, name) is not hook)
+
+
 class Tk(tkinter.Tk):
     """
     Main window
@@ -327,6 +342,7 @@ class Canvas(tkinter.Canvas):
         zoom_item: bool = False,
         keep_ratio: typing.Literal["min", "max"] | None = None,
         free_anchor: bool = False,
+        coalesce: int | None = None,
         name: str | None = None,
         **kwargs,
     ) -> None:
@@ -337,8 +353,14 @@ class Canvas(tkinter.Canvas):
         * `keep_ratio`: the mode of aspect ratio, `min` follows the minimum
         value, `max` follows the maximum value
         * `free_anchor`: whether the anchor point is free-floating
+        * `coalesce`: if it is not None, events of moving the mouse are merged,
+        and only the latest one is handled per frame at this frame rate
         * `kwargs`: compatible with other parameters of class `tkinter.Canvas`
         """
+        if coalesce is not None and not (isinstance(coalesce, int) and coalesce > 0):
+            raise ValueError(
+                f"The frame rate of coalescing must be a positive int, not {coalesce!r}.")
+
         tkinter.Canvas.__init__(self, master, **kwargs)
 
         # The following four attributes are not initialized yet, only types are
@@ -357,6 +379,19 @@ class Canvas(tkinter.Canvas):
         self._images: dict[int, list[enhanced.PhotoImage]] = {}
         # initial image, now image
 
+        self._orders = itertools.count()  # z-order of widgets
+        self._lowest = itertools.count(-1, -1)  # z-order of lowered widgets
+        self._index = tools._SpatialIndex()  # bounding boxes of widgets
+        self._stale: set[virtual.Widget] = set()  # boxes need to be updated
+        self._hovered: list[virtual.Widget] = []  # under the mouse, top first
+        self._grabbed: list[virtual.Widget] = []  # hit by the last press
+        self._handlers: collections.defaultdict[
+            str, dict[virtual.Widget, typing.Callable[[tkinter.Event], typing.Any]]
+        ] = collections.defaultdict(dict)  # overridden hooks of features
+        self._focused: virtual.Widget | None = None  # receives keyboard events
+        self._focus_chain: list[virtual.Widget] | None = None  # Tab order
+        self._fonts = tools._FontPool()  # fonts shared by the texts
+
         self.name = name
 
         self.master: Tk | Canvas  # Coverred original type hint
@@ -365,19 +400,26 @@ class Canvas(tkinter.Canvas):
         self._zoom_item = zoom_item
         self._free_anchor = free_anchor
         self._keep_ratio: typing.Literal["min", "max"] | None = keep_ratio
+        self._coalesce = coalesce
+
+        self._pending_motion: tuple[tkinter.Event, str] | None = None
+        self._motion_task: str | None = None
 
         self._trigger_config = tools._Trigger(
             lambda **kwargs: self.configure(
                 **{k: v for k, v in kwargs.items() if self[k] != v}))
-        self._trigger_focus = tools._Trigger(self.focus)
+        self._trigger_focus = tools._Trigger(self._focus)
 
         self._theme(manager.get_color_mode() == "dark")
 
         master._canvases.append(self)
 
         self.bind("<Any-Key>", self._input)
+        self.bind("<Tab>", lambda event: self._traverse(event, 1))
+        self.bind("<Shift-Tab>", lambda event: self._traverse(event, -1))
 
         if platform.system() == "Linux":
+            self.bind("<ISO_Left_Tab>", lambda event: self._traverse(event, -1))
             self.bind("<Button-4>", lambda event: self._wheel(event, "up"))
             self.bind("<Button-5>", lambda event: self._wheel(event, "down"))
         else:
@@ -387,10 +429,10 @@ class Canvas(tkinter.Canvas):
         self.bind("<Button-2>", lambda event: self._click(event, "center"))
         self.bind("<Button-3>", lambda event: self._click(event, "right"))
 
-        self.bind("<Motion>", lambda event: self._move(event, "none"))
-        self.bind("<B1-Motion>", lambda event: self._move(event, "left"))
-        self.bind("<B2-Motion>", lambda event: self._move(event, "center"))
-        self.bind("<B3-Motion>", lambda event: self._move(event, "right"))
+        self.bind("<Motion>", lambda event: self._motion(event, "none"))
+        self.bind("<B1-Motion>", lambda event: self._motion(event, "left"))
+        self.bind("<B2-Motion>", lambda event: self._motion(event, "center"))
+        self.bind("<B3-Motion>", lambda event: self._motion(event, "right"))
 
         self.bind("<ButtonRelease-1>",
                   lambda event: self._release(event, "left"))
@@ -510,6 +552,7 @@ class Canvas(tkinter.Canvas):
         if self._zoom_item:
             relative_ratio = tuple(i/j for i, j in zip(self._size, last_size))
             self._zoom_children(relative_ratio)
+            self._fonts.zoom(math.sqrt(self.ratios[0]*self.ratios[1]))
             for widget in self._widgets:
                 widget.zoom(relative_ratio)
 
@@ -530,43 +573,218 @@ class Canvas(tkinter.Canvas):
 
     # @typing.override
     def destroy(self) -> None:
+        if self._motion_task is not None:
+            self.after_cancel(self._motion_task)
+        for widget in self._widgets:
+            for component in widget.components:
+                component._pause()
         self.master._canvases.remove(self)
         return tkinter.Canvas.destroy(self)
 
     def clear(self) -> None:
         """Clear all things in the Canvas"""
+        for widget in self._widgets:
+            for component in widget.components:
+                component._teardown()
         self._canvases.clear()
         self._widgets.clear()
         self._items.clear()
         self._images.clear()
+        self._index.clear()
+        self._stale.clear()
+        self._hovered.clear()
+        self._grabbed.clear()
+        self._handlers.clear()
+        self._focused = self._focus_chain = None
+        self._fonts.clear()
         for child in self.children.values():
             child.destroy()
         self.delete(*self.find_all())
 
     # @typing.override
     def create_text(self, x: float, y: float, /, **kwargs) -> int:
-        # XXX: Need to be improved
+        # Fonts given by options are taken from the pool and stay referenced
+        # for the lifetime of the canvas, so that equal options share a font
         if not (font_ := kwargs.get("font")):
-            kwargs["font"] = tkinter.font.Font(
-                family=constants.FONT, size=constants.SIZE)
+            kwargs["font"] = self._fonts.acquire(self._fonts.key())
         elif isinstance(font_, str):
-            kwargs["font"] = tkinter.font.Font(
-                family=font_, size=constants.SIZE)
+            kwargs["font"] = self._fonts.acquire(self._fonts.key(font_))
         elif isinstance(font_, int):
-            kwargs["font"] = tkinter.font.Font(
-                family=constants.FONT, size=-abs(font_))
+            kwargs["font"] = self._fonts.acquire(self._fonts.key(size=font_))
         elif isinstance(font_, tkinter.font.Font):
-            kwargs["font"].config(size=-abs(font_.cget("size")))
+            if font_.cget("size") > 0:
+                font_.config(size=-font_.cget("size"))
         else:
-            (font_ := list(font_))[1] = -abs(font_[1])
-            length = len(font_)
-            kwargs["font"] = tkinter.font.Font(
-                family=font_[0], size=font_[1],
-                weight=font_[2] if length > 2 else "normal",
-                slant=font_[3] if length > 3 else "roman")
+            kwargs["font"] = self._fonts.acquire(self._fonts.key(*font_[:4]))
 
         return tkinter.Canvas.create_text(self, x, y, **kwargs)
 
+    def _hit(self, x: float, y: float) -> list[virtual.Widget]:
+        """
+        Return the widgets whose bounding box contains the point
+
+        * `x`: x-coordinate of the point
+        * `y`: y-coordinate of the point
+        """
+        for widget in self._stale:
+            if widget._feature is not None and widget.visible:
+                self._index.insert(widget, widget.bbox())
+            else:
+                self._index.remove(widget)
+        self._stale.clear()
+        return self._index.query(x, y)
+
+    def _subscribe(self, widget: virtual.Widget) -> None:
+        """
+        Record the hooks that the feature of the widget overrides
+
+        * `widget`: the widget whose feature has been attached
+        """
+        self._unsubscribe(widget)
+        for name in _overridden_hooks(type(widget._feature)):
+            self._handlers[name][widget] = getattr(widget._feature, name)
+        if widget in self._handlers["_focus_in"]:
+            self._focus_chain = None
+
+    def _unsubscribe(self, widget: virtual.Widget) -> None:
+        """
+        Forget all the hooks of the widget
+
+        * `widget`: the widget
+        """
+        if widget in self._handlers["_focus_in"]:
+            self._focus_chain = None
+        if self._focused is widget:
+            self._focused = None
+        for handlers in self._handlers.values():
+            handlers.pop(widget, None)
+
+    def _targets(
+        self,
+        name: str,
+        *groups: typing.Iterable[virtual.Widget],
+    ) -> list[tuple[virtual.Widget, typing.Callable[[tkinter.Event], typing.Any]]]:
+        """
+        Return the widgets that handle the hook and their handlers, sorted from
+        top to bottom
+
+        * `name`: name of the hook
+        * `groups`: groups of widgets, the widgets that do not handle the hook
+        are ignored, and all the subscribers are used if it is empty
+        """
+        handlers = self._handlers[name]
+        if groups:
+            widgets = {widget for group in groups for widget in group
+                       if widget in handlers}
+        else:
+            widgets = handlers.keys()
+        return [(widget, handlers[widget]) for widget in
+                sorted(widgets, key=lambda widget: widget._order, reverse=True)]
+
+    def _focus(self, widget: virtual.Widget | None) -> None:
+        """
+        Move the focus to a widget
+
+        * `widget`: the widget that gets the focus, None indicates that no
+        widget has the focus
+        """
+        if widget is self._focused:
+            return
+        previous, self._focused = self._focused, widget
+        if (handler := self._handlers["_focus_out"].get(previous)) is not None:
+            handler()
+        if widget is None:
+            self.focus("")
+        elif (handler := self._handlers["_focus_in"].get(widget)) is not None:
+            handler()
+
+    def _traverse(self, event: tkinter.Event, step: typing.Literal[1, -1]) -> str:
+        """
+        Move the focus to the next or the previous focusable widget, and
+        return "break" if a widget takes the focus
+
+        * `event`: the event of pressing the key
+        * `step`: 1 indicates the next one and -1 indicates the previous one
+        """
+        if self._focus_chain is None:
+            self._focus_chain = sorted(
+                self._handlers["_focus_in"], key=lambda widget: widget._order)
+        chain = self._focus_chain
+        if self._focused in self._handlers["_focus_in"]:
+            index = chain.index(self._focused)
+        else:
+            index = -1 if step > 0 else len(chain)
+        for index in range(index+step, len(chain) if step > 0 else -1, step):
+            widget = chain[index]
+            if widget.state != "disabled" and widget.visible:
+                self._focus(widget)
+                return "break"
+        self._focus(None)  # Let Tk move the focus out of the canvas
+        return None
+
+    def _deliver(self, name: str, event: tkinter.Event) -> None:
+        """
+        Send an event of the keyboard to the focused widget
+
+        * `name`: name of the hook
+        * `event`: the event
+        """
+        if (handler := self._handlers[name].get(self._focused)) is not None:
+            handler(event)
+
+    def _propagate(
+        self,
+        targets: list[tuple[virtual.Widget, typing.Callable[[tkinter.Event], typing.Any]]],
+        event: tkinter.Event,
+    ) -> list[virtual.Widget]:
+        """
+        Call the handlers from top to bottom until one of them consumes the
+        event, and return the widgets that are not reached
+
+        * `targets`: the widgets and their handlers, sorted from top to bottom
+        * `event`: the event
+        """
+        for index, (widget, handler) in enumerate(targets):
+            if handler(event) and not widget.through:
+                return [widget for widget, _ in targets[index+1:]]
+        return []
+
+    def _motion(
+        self,
+        event: tkinter.Event,
+        type_: typing.Literal["left", "center", "right", "none"]
+    ) -> None:
+        """
+        Handle an event of moving the mouse, or keep it until the next frame
+        when the events are coalesced
+        """
+        if self._coalesce is None:
+            return self._move(event, type_)
+        if self._pending_motion is not None and self._pending_motion[1] != type_:
+            self._flush_motion()  # Events of different buttons are not merged
+        if self._motion_task is None:
+            self._move(event, type_)
+            self._motion_task = self.after(
+                max(1, 1000 // self._coalesce), self._motion_frame)
+        else:
+            self._pending_motion = event, type_
+
+    def _motion_frame(self) -> None:
+        """Handle the latest event of moving the mouse in this frame"""
+        if self._pending_motion is None:
+            self._motion_task = None
+        else:
+            self._flush_motion()
+            self._motion_task = self.after(
+                max(1, 1000 // self._coalesce), self._motion_frame)
+
+    def _flush_motion(self) -> None:
+        """Handle the pending event of moving the mouse immediately"""
+        if self._pending_motion is not None:
+            event, type_ = self._pending_motion
+            self._pending_motion = None
+            self._move(event, type_)
+
     def _move(
         self,
         event: tkinter.Event,
@@ -574,10 +792,25 @@ class Canvas(tkinter.Canvas):
     ) -> None:
         """Internal Method: Events to move the mouse"""
         self._trigger_config.reset()
-        for widget in self._widgets[::-1]:
-            if widget._feature is not None:
-                if getattr(widget._feature, f"_move_{type_}")(event) and not widget.through:
-                    event.x = math.nan
+        hits = self._hit(event.x, event.y)
+        if type_ == "none":
+            targets = self._targets("_move_none", hits)
+        else:
+            targets = self._targets(f"_move_{type_}", hits, self._grabbed)
+        hovered: list[virtual.Widget] = []
+        for widget, handler in targets:
+            if handler(event):
+                hovered.append(widget)
+                if not widget.through:
+                    break
+        leave, enter = self._handlers["_leave"], self._handlers["_enter"]
+        for widget in self._hovered:
+            if widget not in hovered and widget in leave:
+                leave[widget](event)
+        for widget in hovered:
+            if widget not in self._hovered and widget in enter:
+                enter[widget](event)
+        self._hovered = hovered
         self._trigger_config.update(cursor="arrow")
 
     def _click(
@@ -586,13 +819,18 @@ class Canvas(tkinter.Canvas):
         type_: typing.Literal["left", "center", "right"]
     ) -> None:
         """Events to active the mouse"""
+        self._flush_motion()
         self.focus_set()
         self._trigger_focus.reset()
-        for widget in self._widgets[::-1]:
-            if widget._feature is not None:
-                if getattr(widget._feature, f"_click_{type_}")(event) and not widget.through:
-                    event.x = math.nan
-        self._trigger_focus.update(True, "")
+        hits = self._hit(event.x, event.y)
+        targets = self._targets(f"_click_{type_}", hits, self._grabbed)
+        missed = self._propagate(targets, event)
+        reached = {widget for widget, _ in targets}.difference(missed)
+        for widget, handler in self._targets("_click_outside"):
+            if widget not in reached:  # All the subscribers, wherever they are
+                handler(event)
+        self._grabbed = hits
+        self._trigger_focus.update(True, None)
 
     def _release(
         self,
@@ -600,10 +838,12 @@ class Canvas(tkinter.Canvas):
         type_: typing.Literal["left", "center", "right"]
     ) -> None:
         """Events to release the mouse"""
-        for widget in self._widgets[::-1]:
-            if widget._feature is not None:
-                if getattr(widget._feature, f"_release_{type_}")(event) and not widget.through:
-                    event.x = math.nan
+        self._flush_motion()
+        hits = self._hit(event.x, event.y)
+        grabbed = self._targets(f"_release_{type_}", self._grabbed)
+        self._propagate(grabbed + [
+            target for target in self._targets(f"_release_{type_}", hits)
+            if target not in grabbed], event)  # Widgets pressed come first
 
     def _wheel(
         self,
@@ -613,45 +853,28 @@ class Canvas(tkinter.Canvas):
         """Events to scroll the mouse wheel"""
         if type_ is not None:
             event.delta = 120 if type_ == "up" else -120
-        for widget in self._widgets[::-1]:
-            if widget._feature is not None:
-                if getattr(widget._feature, "_wheel")(event) and not widget.through:
-                    event.x = math.nan
+        self._flush_motion()
+        self._propagate(self._targets("_wheel"), event)
 
     def _input(self, event: tkinter.Event) -> None:
         """Event for typing"""
-        for widget in self._widgets[::-1]:
-            if widget._feature is not None:
-                if getattr(widget._feature, "_input")(event) and not widget.through:
-                    event.x = math.nan
+        self._deliver("_input", event)
 
     def _copy(self, event: tkinter.Event) -> None:
         """Event for copy operation"""
-        for widget in self._widgets[::-1]:
-            if widget._feature is not None:
-                if getattr(widget._feature, "_copy")(event) and not widget.through:
-                    pass
+        self._deliver("_copy", event)
 
     def _paste(self, event: tkinter.Event) -> None:
         """Event for paste operation"""
-        for widget in self._widgets[::-1]:
-            if widget._feature is not None:
-                if getattr(widget._feature, "_paste")(event) and not widget.through:
-                    pass
+        self._deliver("_paste", event)
 
     def _cut(self, event: tkinter.Event) -> None:
         """Event for cut operation"""
-        for widget in self._widgets[::-1]:
-            if widget._feature is not None:
-                if getattr(widget._feature, "_cut")(event) and not widget.through:
-                    pass
+        self._deliver("_cut", event)
 
     def _select_all(self, event: tkinter.Event) -> None:
         """Event for operation of selecting all"""
-        for widget in self._widgets[::-1]:
-            if widget._feature is not None:
-                if getattr(widget._feature, "_select_all")(event) and not widget.through:
-                    pass
+        self._deliver("_select_all", event)
 
 
 class Frame(Canvas):
@@ -665,6 +888,7 @@ class Frame(Canvas):
         zoom_item: bool = False,
         keep_ratio: typing.Literal["min", "max"] | None = None,
         free_anchor: bool = False,
+        coalesce: int | None = None,
         name: str | None = None,
         **kwargs,
     ) -> None:
@@ -675,8 +899,10 @@ class Frame(Canvas):
         * `keep_ratio`: the mode of aspect ratio, `min` follows the minimum
         value, `max` follows the maximum value
         * `free_anchor`: whether the anchor point is free-floating
+        * `coalesce`: if it is not None, events of moving the mouse are merged,
+        and only the latest one is handled per frame at this frame rate
         * `kwargs`: compatible with other parameters of class `tkinter.Canvas`
         """
         Canvas.__init__(self, master, expand=expand, zoom_item=zoom_item,
                         keep_ratio=keep_ratio, free_anchor=free_anchor,
-                        name=name, **kwargs)
+                        coalesce=coalesce, name=name, **kwargs)
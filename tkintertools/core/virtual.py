@@ -16,7 +16,6 @@ import abc
 import copy
 import math
 import tkinter
-import tkinter.font
 import typing
 
 from ..animation import animations
@@ -67,8 +66,10 @@ class Component(abc.ABC):
         self.styles = styles if styles else parser.get(widget, self)
 
         self.items: list[int] = []
-        self.gradient: animations.GradientItem | None = None
+        self._options: dict[int, tuple[tuple[str, str], ...]] = {}
+        self._transitions: dict[str, animations.ColorTransition | None] = {}
         self.visible: bool = True
+        self._outdated: bool = False  # style updates skipped while hidden
 
         self.kwargs = kwargs
 
@@ -78,6 +79,7 @@ class Component(abc.ABC):
         """Move the `Component`"""
         self.position[0] += dx
         self.position[1] += dy
+        self.widget.master._stale.add(self.widget)
         for item in self.items:
             self.widget.master.move(item, dx, dy)
 
@@ -87,9 +89,14 @@ class Component(abc.ABC):
 
     def destroy(self) -> None:
         """Destroy the `Component`"""
+        self._teardown()
         self.widget.deregister(self)
         self.widget.master.delete(*self.items)
 
+    def _teardown(self) -> None:
+        """Stop what is running and release what is held before destroying"""
+        self._pause()
+
     def center(self) -> tuple[int, int]:
         """Return the geometric center of the `Component`"""
         return self.position[0] + self.size[0]/2, self.position[1] + self.size[1]/2
@@ -101,7 +108,9 @@ class Component(abc.ABC):
 
     def detect(self, x: int, y: int) -> bool:
         """Detect whether the specified coordinates are within the `Component`"""
-        x1, y1, x2, y2 = self.region()
+        if (region := self.region()) is None:
+            return False  # Hidden or empty items have no bounding box
+        x1, y1, x2, y2 = region
         return x1 <= x <= x2 and y1 <= y <= y2
 
     def update(self, state: str | None = None, *, no_delay: bool = False) -> None:
@@ -110,13 +119,12 @@ class Component(abc.ABC):
 
         * `state`: the state of the `Component`
         """
-        if not self.visible:
+        if not (self.visible and self.widget.visible):
+            self._outdated = True
             return
+        self._outdated = False
         if state is None:
             state = self.widget.state
-        if self.gradient is not None:
-            self.gradient.stop()
-            self.gradient = None
         if self.styles.get(state) is not None:
             self.configure(self.styles[state], no_delay=no_delay)
 
@@ -135,46 +143,54 @@ class Component(abc.ABC):
 
     def configure(self, style: dict[str, str], *, no_delay: bool = False) -> None:
         """Configure properties of the `Component` and update them immediately"""
-        for item in self.items:
-            tags = self.widget.master.itemcget(item, "tags").split()
-            kwargs = {key: value for key, param in zip(
-                tags[0:-1:2], tags[1:len(tags):2]) if (value := style.get(param)) is not None}
-            if self.widget.animation and self.animation and not no_delay:
-                for key, value in kwargs.items():
-                    start_color: str = self.widget.master.itemcget(item, key)
-                    if start_color.startswith("#") and len(start_color) == 9:
-                        start_color = rgb.rgb_to_str(rgb._str_to_rgba(
-                            start_color, reference=self.widget.master["bg"]))
-                    if value.startswith("#") and len(value) == 9:
-                        value = rgb.rgb_to_str(rgb._str_to_rgba(
-                            value, reference=self.widget.master["bg"]))
-                    if value == "" or start_color == "":  # Null characters cannot be parsed
-                        self.widget.master.itemconfigure(item, **{key: value})
-                    else:
-                        self.gradient = animations.GradientItem(
-                            self.widget.master, item, key, 150, (start_color, value))
-                        self.gradient.start()
-            else:
-                for key, value in kwargs.items():
-                    if value.startswith("#") and len(value) == 9:
-                        kwargs[key] = rgb.rgb_to_str(rgb._str_to_rgba(
-                            value, reference=self.widget.master["bg"]))
-                self.widget.master.itemconfigure(item, **kwargs)
+        no_delay = no_delay or not (self.widget.animation and self.animation)
+        for param, value in style.items():
+            if (transition := self._transition(param)) is None:
+                continue
+            if value.startswith("#") and len(value) == 9:
+                value = rgb.rgb_to_str(rgb._str_to_rgba(
+                    value, reference=self.widget.master["bg"]))
+            transition.retarget(value, no_delay=no_delay)
+
+    def _transition(self, param: str) -> "animations.ColorTransition | None":
+        """
+        Return the color transition of the items that use a style parameter
+
+        * `param`: name of the style parameter
+        """
+        if param not in self._transitions:
+            targets = [(item, key) for item, options in self._options.items()
+                       for key, value in options if value == param]
+            self._transitions[param] = animations.ColorTransition(
+                self.widget.master, targets, 150) if targets else None
+        return self._transitions[param]
 
     def appear(self, *, no_delay: bool = True) -> None:
         """Let the component to appear"""
         self.visible = True
-        self.update(self.widget.state, no_delay=no_delay)
+        if self.widget.visible:
+            for item in self.items:
+                self.widget.master.itemconfigure(item, state="")
+            if self._outdated:
+                self.update(self.widget.state, no_delay=no_delay)
+            self._resume()
 
     def disappear(self, *, no_delay: bool = True) -> None:
         """Let the component to disappear"""
         self.visible = False
-        temp_style = copy.deepcopy(self.styles.get(self.widget.state, None))
-        if temp_style is None:
-            return
-        for arg in temp_style:
-            temp_style[arg] = ""
-        self.configure(temp_style, no_delay=no_delay)
+        self._pause()
+        for item in self.items:
+            self.widget.master.itemconfigure(item, state="hidden")
+
+    def _pause(self) -> None:
+        """Stop the color transitions, and finish them when it appears again"""
+        for transition in self._transitions.values():
+            if transition is not None and transition._clock is not None:
+                transition.stop()
+                self._outdated = True
+
+    def _resume(self) -> None:
+        """Restart what is paused when the component is hidden, if anything"""
 
     def __getitem__(self, key: str) -> dict[str, str]:
         """Easy to get style data"""
@@ -209,6 +225,7 @@ class Component(abc.ABC):
             self.size = list(size)
         if position is not None:
             self.position = list(position)
+        self.widget.master._stale.add(self.widget)
 
 
 class Shape(Component):
@@ -278,26 +295,50 @@ class Text(Component):
         self.limit = limit
         self.anchor = anchor
         self.justify = justify
-        self.font = tkinter.font.Font(
-            family=family if family else constants.FONT,
-            size=-abs(fontsize if fontsize else constants.SIZE),
-            weight=weight, slant=slant,
-            underline=underline, overstrike=overstrike)
-        self._initial_fontsize = self.font.cget("size")
+        self._font_key = widget.master._fonts.key(
+            family, fontsize, weight, slant, underline, overstrike)
+        self.font = widget.master._fonts.acquire(self._font_key)
         Component.__init__(self, widget, relative_position, size, name=name,
                            styles=styles, animation=animation, **kwargs)
 
+    # @typing.override
+    def _teardown(self) -> None:
+        Component._teardown(self)
+        self.widget.master._fonts.release(self._font_key)
+
     def region(self) -> tuple[int, int, int, int]:
         """Return the decision region of the `Text`"""
         return self.widget.master.bbox(self.items[0])
 
-    # @typing.override
-    def zoom(self, ratios: tuple[float, float]) -> None:
-        """Scale the text"""
-        Component.zoom(self, ratios)
-        ratios = self.widget.master.ratios
-        self.font.config(size=round(
-            self._initial_fontsize*math.sqrt(ratios[0]*ratios[1])))
+    def configure_font(self, **options) -> None:
+        """
+        Configure the font of the `Text`
+
+        The font is shared with other texts, so it is not modified. The `Text`
+        switches to the font of the new options in the pool instead.
+
+        * `options`: `family`, `size`, `weight`, `slant`, `underline` or
+        `overstrike` of the font, the size is the one before zooming
+        """
+        key = self.widget.master._fonts.key(
+            **self._font_key._replace(**options)._asdict())
+        if key == self._font_key:
+            return
+        self.font = self.widget.master._fonts.acquire(key)
+        for item in self.items:
+            self.widget.master.itemconfigure(item, font=self.font)
+        self.widget.master._fonts.release(self._font_key)
+        self._font_key = key
+        self.widget.master._stale.add(self.widget)
+
+    def cget_font(self, option: str) -> typing.Any:
+        """
+        Return the value of an option of the font
+
+        * `option`: `family`, `size`, `weight`, `slant`, `underline` or
+        `overstrike` of the font, the size is the one before zooming
+        """
+        return getattr(self._font_key, option)
 
 
 class Image(Component):
@@ -334,7 +375,9 @@ class Image(Component):
     def zoom(self, ratios: tuple[float, float]) -> None:
         """Scale the image"""
         Component.zoom(self, ratios)
-        self.image = self._initail_image.scale(*self.widget.master.ratios)
+        if self._initail_image is not None:
+            self.image = enhanced._scaled_images.get(
+                self._initail_image, *self.widget.master.ratios)
         for item in self.items:
             self.widget.master.itemconfigure(item, image=self.image)
 
@@ -348,6 +391,14 @@ class Feature(abc.ABC):
         """
         self.widget = widget
         widget._feature = self
+        widget.master._stale.add(widget)
+        widget.master._subscribe(widget)
+
+    def _enter(self, event: tkinter.Event) -> None:
+        """Event of the mouse entering the widget"""
+
+    def _leave(self, event: tkinter.Event) -> None:
+        """Event of the mouse leaving the widget"""
 
     def _move_none(self, event: tkinter.Event) -> bool:
         """Event of moving the mouse"""
@@ -377,6 +428,9 @@ class Feature(abc.ABC):
         """Event of pressing the right mouse button"""
         return False
 
+    def _click_outside(self, event: tkinter.Event) -> None:
+        """Event of pressing a mouse button that does not reach the widget"""
+
     def _release_left(self, event: tkinter.Event) -> bool:
         """Event of releasing the left mouse button"""
         return False
@@ -393,6 +447,12 @@ class Feature(abc.ABC):
         """Event of scrolling the mouse wheel"""
         return False
 
+    def _focus_in(self) -> None:
+        """Event of getting the focus of the keyboard"""
+
+    def _focus_out(self) -> None:
+        """Event of losing the focus of the keyboard"""
+
     def _input(self, event: tkinter.Event) -> bool:
         """Event of typing"""
         return False
@@ -463,6 +523,11 @@ class Widget:
         self._images: list[Image] = []
         self._feature: Feature = None
         self._state_before_disabled: str = ""
+        self.visible: bool = True
+        self._order: int = next(self.master._orders)  # z-order on the canvas
+        self._tag = f"_widget{self._order}"  # tag of all items of the widget
+        self._tags: tuple[str, ...] = (self._tag,) if self.widget is None \
+            else (self._tag, *self.widget._tags)
 
         self.master._widgets.append(self)
 
@@ -485,8 +550,13 @@ class Widget:
         elif isinstance(component, Image):
             self._images.append(component)
         component.display()
+        for item in component.items:
+            tags = self.master.itemcget(item, "tags").split()
+            component._options[item] = tuple(zip(tags[0::2], tags[1::2]))
+            self.master.itemconfigure(item, tags=(*tags, *self._tags))
         component.coords()
         component.update(no_delay=True)
+        self.master._stale.add(self)
 
     def deregister(self, component: Component) -> None:
         """Deregister a component from the widget"""
@@ -520,14 +590,23 @@ class Widget:
         for widget in self.widgets:
             widget.disabled(value)
 
+    def _subtree(self) -> list["Widget"]:
+        """Return the widget and all its descendant widgets, parents first"""
+        widgets = [self]
+        for widget in self._widgets:
+            widgets += widget._subtree()
+        return widgets
+
     def move(self, dx: int, dy: int) -> None:
         """Move the widget"""
-        self.position[0] += dx
-        self.position[1] += dy
-        for component in self.components:
-            component.move(dx, dy)
-        for widget in self.widgets:
-            widget.move(dx, dy)
+        for widget in self._subtree():
+            widget.position[0] += dx
+            widget.position[1] += dy
+            self.master._stale.add(widget)
+            for component in widget.components:
+                component.position[0] += dx
+                component.position[1] += dy
+        self.master.move(self._tag, dx, dy)
 
     def moveto(self, x: int, y: int) -> None:
         """Move the Widget to a certain position"""
@@ -535,14 +614,49 @@ class Widget:
 
     def destroy(self) -> None:
         """Destroy the widget"""
-        self.master._widgets.remove(self)
         if self.widget is not None:
             self.widget._widgets.remove(self)
+        for widget in self._subtree():
+            self.master._widgets.remove(widget)
+            self.master._index.remove(widget)
+            self.master._stale.discard(widget)
+            self.master._unsubscribe(widget)
+            for component in widget.components:
+                component._teardown()
+                widget.deregister(component)
+        self.master.delete(self._tag)
+
+    def lift(self) -> None:
+        """Raise the widget and all its descendant widgets to the top"""
+        widgets = self._subtree()
+        for widget in widgets:
+            widget._order = next(self.master._orders)
+        self._restack(widgets, top=True)
+
+    def lower(self) -> None:
+        """Lower the widget and all its descendant widgets to the bottom"""
+        widgets = self._subtree()
+        for widget in reversed(widgets):
+            widget._order = next(self.master._lowest)
+        self._restack(widgets, top=False)
+
+    def _restack(self, widgets: list["Widget"], *, top: bool) -> None:
+        """
+        Keep the stacking order of items and the list of widgets in sync with
+        the z-order of the widgets
 
-        for component in self.components:
-            component.destroy()
-        for widget in self.widgets:
-            widget.destroy()
+        * `widgets`: the widget and all its descendant widgets
+        * `top`: whether the widgets are raised to the top
+        """
+        members = set(widgets)
+        others = [widget for widget in self.master._widgets
+                  if widget not in members]
+        self.master._widgets[:] = others + widgets if top else widgets + others
+        self.master._focus_chain = None
+        if top:
+            self.master.tag_raise(self._tag)
+        else:
+            self.master.tag_lower(self._tag)
 
     def detect(self, x: int, y: int) -> bool:
         """Detect whether the specified coordinates are within the `Widget`"""
@@ -550,6 +664,17 @@ class Widget:
         x2, y2 = x1 + w, y1 + h
         return x1 <= x <= x2 and y1 <= y <= y2
 
+    def bbox(self) -> tuple[float, float, float, float]:
+        """Return the bounding box of the `Widget` and all its components"""
+        x1, y1 = self.position
+        x2, y2 = x1 + self.size[0], y1 + self.size[1]
+        for component in self.components:
+            if (region := component.region()) is None:
+                continue  # Maybe the text is empty
+            x1, y1 = min(x1, region[0]), min(y1, region[1])
+            x2, y2 = max(x2, region[2]), max(y2, region[3])
+        return x1, y1, x2, y2
+
     def zoom(self, ratios: tuple[float, float] | None = None) -> None:
         """Zoom self"""
         if ratios is None:
@@ -560,19 +685,32 @@ class Widget:
         self.size[1] *= ratios[1]
         self.position[0] *= ratios[0]
         self.position[1] *= ratios[1]
+        self.master._stale.add(self)
         for component in self.components:
             component.zoom(ratios)
 
     def disappear(self) -> None:
-        """Let all components of the widget to disappear"""
-        for component in self.components:
-            component.disappear()
-        for widget in self.widgets:
-            widget.disappear()
+        """Let the widget and all its descendant widgets to disappear"""
+        for widget in self._subtree():
+            widget.visible = False
+            self.master._stale.add(widget)
+            for component in widget.components:
+                component._pause()
+        self.master.itemconfigure(self._tag, state="hidden")
 
     def appear(self) -> None:
-        """Let all components of the widget to appear"""
-        for component in self.components:
-            component.appear()
-        for widget in self.widgets:
-            widget.appear()
+        """Let the widget and all its descendant widgets to appear"""
+        widgets = self._subtree()
+        for widget in widgets:
+            widget.visible = True
+            self.master._stale.add(widget)
+        self.master.itemconfigure(self._tag, state="")
+        for widget in widgets:
+            for component in widget.components:
+                if not component.visible:  # It is hidden by itself
+                    for item in component.items:
+                        self.master.itemconfigure(item, state="hidden")
+                else:
+                    if component._outdated:
+                        component.update(no_delay=True)
+                    component._resume()
@@ -33,10 +33,13 @@ class LabelFeature(virtual.Feature):
             if self.widget.state != "hover":
                 self.widget.update("hover")
         else:
-            if self.widget.state != "normal":
-                self.widget.update("normal")
+            self._leave(event)
         return flag
 
+    def _leave(self, _: tkinter.Event) -> None:
+        if self.widget.state != "normal":
+            self.widget.update("normal")
+
 
 class ButtonFeature(virtual.Feature):
     """Feature of Button"""
@@ -63,10 +66,13 @@ class ButtonFeature(virtual.Feature):
             if self.widget.state == "normal":
                 self.widget.update("hover")
         else:
-            if self.widget.state != "normal":
-                self.widget.update("normal")
+            self._leave(event)
         return flag
 
+    def _leave(self, _: tkinter.Event) -> None:
+        if self.widget.state != "normal":
+            self.widget.update("normal")
+
     def _move_left(self, event: tkinter.Event) -> bool:
         return self._move_none(event)
 
@@ -99,13 +105,16 @@ class Underline(ButtonFeature):
             self.widget.master._trigger_config.update(cursor="hand2")
             if self.widget.state == "normal":
                 self.widget.update("hover")
-                self.widget._texts[0].font.config(underline=True)
+                self.widget._texts[0].configure_font(underline=True)
         else:
-            if self.widget.state != "normal":
-                self.widget.update("normal")
-                self.widget._texts[0].font.config(underline=False)
+            self._leave(event)
         return flag
 
+    def _leave(self, _: tkinter.Event) -> None:
+        if self.widget.state != "normal":
+            self.widget.update("normal")
+            self.widget._texts[0].configure_font(underline=False)
+
     def _click_left(self, _: tkinter.Event) -> bool:
         if flag := self.widget.state == "hover":
             self.widget.update("active")
@@ -116,7 +125,7 @@ class Underline(ButtonFeature):
         if flag := self.widget._texts[0].detect(event.x, event.y):
             if self.widget.state == "active":
                 self.widget.update("hover")
-                self.widget._texts[0].font.config(underline=True)
+                self.widget._texts[0].configure_font(underline=True)
                 if self._command is not None:
                     self._command(*self._args)
         return flag
@@ -131,19 +140,22 @@ class Highlight(ButtonFeature):
             if self.widget.state == "normal":
                 self.widget.update("hover")
                 animations.ScaleFontSize(
-                    self.widget._texts[0], 150, sizes=28).start()
+                    self.widget._texts[0], 150, sizes=28, skip=True).start()
         else:
-            if self.widget.state != "normal":
-                self.widget.update("normal")
-                animations.ScaleFontSize(
-                    self.widget._texts[0], 150, sizes=24).start()
+            self._leave(event)
         return flag
 
+    def _leave(self, _: tkinter.Event) -> None:
+        if self.widget.state != "normal":
+            self.widget.update("normal")
+            animations.ScaleFontSize(
+                self.widget._texts[0], 150, sizes=24, skip=True).start()
+
     def _click_left(self, _: tkinter.Event) -> bool:
         if flag := self.widget.state == "hover":
             self.widget.update("active")
             animations.ScaleFontSize(
-                self.widget._texts[0], 150, sizes=26).start()
+                self.widget._texts[0], 150, sizes=26, skip=True).start()
         return flag
 
     def _release_left(self, event: tkinter.Event) -> bool:
@@ -152,7 +164,7 @@ class Highlight(ButtonFeature):
             if self.widget.state == "active":
                 self.widget.update("hover")
                 animations.ScaleFontSize(
-                    self.widget._texts[0], 150, sizes=28).start()
+                    self.widget._texts[0], 150, sizes=28, skip=True).start()
                 if self._command is not None:
                     self._command(*self._args)
         return flag
@@ -173,16 +185,19 @@ class SwitchFeature(ButtonFeature):
                 self.widget.update(
                     f"hover-{'on' if self.widget.get() else 'off'}")
         else:
-            if not self.widget.state.startswith("normal"):
-                if self.widget.state != "disabled":
-                    self.widget._shapes[-1].coords(
-                        (self.widget.size[0]*3/10, self.widget.size[0]*3/10),
-                        (self.widget._shapes[-1].position[0]+self.widget.size[0]/60,
-                         self.widget._shapes[-1].position[1]+self.widget.size[0]/60))
-                self.widget.update(
-                    f"normal-{'on' if self.widget.get() else 'off'}")
+            self._leave(event)
         return flag
 
+    def _leave(self, _: tkinter.Event) -> None:
+        if not self.widget.state.startswith("normal"):
+            if self.widget.state != "disabled":
+                self.widget._shapes[-1].coords(
+                    (self.widget.size[0]*3/10, self.widget.size[0]*3/10),
+                    (self.widget._shapes[-1].position[0]+self.widget.size[0]/60,
+                     self.widget._shapes[-1].position[1]+self.widget.size[0]/60))
+            self.widget.update(
+                f"normal-{'on' if self.widget.get() else 'off'}")
+
     def _click_left(self, _: tkinter.Event) -> bool:
         if flag := self.widget.state.startswith("hover"):
             self.widget.update(
@@ -231,11 +246,14 @@ class ToggleButtonFeature(ButtonFeature):
                 self.widget.update(
                     f"hover-{'on' if self.widget.get() else 'off'}")
         else:
-            if not self.widget.state.startswith("normal"):
-                self.widget.update(
-                    f"normal-{'on' if self.widget.get() else 'off'}")
+            self._leave(event)
         return flag
 
+    def _leave(self, _: tkinter.Event) -> None:
+        if not self.widget.state.startswith("normal"):
+            self.widget.update(
+                f"normal-{'on' if self.widget.get() else 'off'}")
+
     def _click_left(self, _: tkinter.Event) -> bool:
         if flag := self.widget.state.startswith("hover"):
             self.widget.update(
@@ -282,28 +300,38 @@ class InputBoxFeature(ButtonFeature):
             if self.widget.state == "normal":
                 self.widget.update("hover")
         else:
-            if self.widget.state == "hover":
-                self.widget.update("normal")
+            self._leave(event)
         return flag
 
+    def _leave(self, _: tkinter.Event) -> None:
+        if self.widget.state == "hover":
+            self.widget.update("normal")
+
     def _click_left(self, event: tkinter.Event) -> bool:
         if flag := self.widget._shapes[0].detect(event.x, event.y):
             self.widget.update("active")
             if self.widget.state == "active":  # Maybe widget is disabled
-                self.widget.master._trigger_focus.update(
-                    True, self.widget._texts[0].items[0])
+                self.widget.master._trigger_focus.update(True, self.widget)
                 self._start_index = self.widget._texts[0].cursor_find(event.x)
                 self.widget._texts[0].cursor_set(self._start_index)
+            self.widget._texts[0].select_clear()
+        return flag
+
+    def _focus_in(self) -> None:
+        if self.widget.state != "active":
+            self.widget.update("active")
+        if self.widget.state == "active":
+            self.widget.master.focus(self.widget._texts[0].items[0])
+            self.widget.master.itemconfigure(
+                self.widget._texts[0].items[1], fill="")
+
+    def _focus_out(self) -> None:
+        if self.widget.state != "normal":
+            self.widget.update("normal")
+            if not self.widget._texts[0].get():
                 self.widget.master.itemconfigure(
-                    self.widget._texts[0].items[1], fill="")
-        else:
-            if self.widget.state != "normal":
-                self.widget.update("normal")
-                if not self.widget._texts[0].get():
-                    self.widget.master.itemconfigure(
-                        self.widget._texts[0].items[1], fill="#787878")
+                    self.widget._texts[0].items[1], fill="#787878")
         self.widget._texts[0].select_clear()
-        return flag
 
     def _move_left(self, event: tkinter.Event) -> bool:
         if self.widget.state == "active":
@@ -401,15 +429,18 @@ class SliderFeature(virtual.Feature):
                         (self.widget._shapes[-2].position[0]+self.widget.size[1]/6,
                          self.widget._shapes[-2].position[1]+self.widget.size[1]/6))
         else:
-            if self.widget.state == "hover":
-                self.widget.update("normal")
-                if isinstance(self.widget._shapes[-1], shapes.Oval):
-                    self.widget._shapes[-1].coords(
-                        (self.widget.size[1]/2, self.widget.size[1]/2),
-                        (self.widget._shapes[-2].position[0]+self.widget.size[1]/4,
-                         self.widget._shapes[-2].position[1]+self.widget.size[1]/4))
+            self._leave(event)
         return flag
 
+    def _leave(self, _: tkinter.Event) -> None:
+        if self.widget.state == "hover":
+            self.widget.update("normal")
+            if isinstance(self.widget._shapes[-1], shapes.Oval):
+                self.widget._shapes[-1].coords(
+                    (self.widget.size[1]/2, self.widget.size[1]/2),
+                    (self.widget._shapes[-2].position[0]+self.widget.size[1]/4,
+                     self.widget._shapes[-2].position[1]+self.widget.size[1]/4))
+
     def _click_left(self, event: tkinter.Event) -> bool:
         if self.widget.state == "hover":
             self._temp_position = event.x, event.y
@@ -431,7 +462,8 @@ class SliderFeature(virtual.Feature):
             delta = next_value - temp_value
             animations.Animation(
                 150, controllers.smooth,
-                callback=lambda k: self.widget.set(temp_value + delta*k), fps=60).start()
+                callback=lambda k: self.widget.set(temp_value + delta*k),
+                fps=60, skip=True).start()
 
     def _move_left(self, event: tkinter.Event) -> bool:
         if self._temp_position is not None:
@@ -448,6 +480,8 @@ class SliderFeature(virtual.Feature):
         if self.widget.state == "active":
             self._temp_position = None
             self.widget.update("hover")
+            if not self.widget._shapes[2].detect(event.x, event.y):
+                self._leave(event)  # The mouse may have left during dragging
 
 
 class SpinBoxFeature(virtual.Feature):
@@ -479,7 +513,10 @@ class OptionButtonFeature(virtual.Feature):
 
     def _click_left(self, event: tkinter.Event) -> bool:
         if not (flag := self.widget.detect(event.x, event.y)):
-            if len(self.widget._widgets) == 3:
-                if not self.widget._widgets[-1].detect(event.x, event.y):
-                    self.widget._widgets[-1].destroy()
+            self._click_outside(event)
         return flag
+
+    def _click_outside(self, event: tkinter.Event) -> None:
+        if len(self.widget._widgets) == 3:
+            if not self.widget._widgets[-1].detect(event.x, event.y):
+                self.widget._widgets[-1].destroy()
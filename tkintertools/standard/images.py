@@ -1,12 +1,205 @@
 """All standard Images"""
 
-from ..core import virtual
+import os
+import tkinter
+import weakref
+
+from ..core import constants, virtual
+from ..toolbox import enhanced
+
+try:
+    import PIL.Image
+    import PIL.ImageSequence
+except ImportError:
+    PIL = None
 
 __all__ = [
     "StillImage",
+    "AnimatedImage",
 ]
 
 
+def _gif_durations(data: bytes) -> list[int]:
+    """
+    Return the duration of each frame of GIF data, in milliseconds
+
+    * `data`: the GIF data
+    """
+    def skip(position: int) -> int:
+        """Skip the data sub-blocks starting at the position"""
+        while position < len(data) and data[position]:
+            position += data[position] + 1
+        return position + 1
+
+    position, durations, delay = 13, [], 100
+    if data[10] & 0x80:  # Global color table
+        position += 3 << ((data[10] & 0x07) + 1)
+    while position < len(data):
+        if data[position] == 0x21:  # Extension
+            if data[position+1] == 0xF9:  # Graphic control extension
+                delay = int.from_bytes(data[position+4:position+6], "little")
+                delay = delay*10 if delay > 1 else 100
+            position = skip(position+2)
+        elif data[position] == 0x2C:  # Image descriptor
+            flags = data[position+9]
+            position += 10
+            if flags & 0x80:  # Local color table
+                position += 3 << ((flags & 0x07) + 1)
+            position = skip(position+1)  # After the LZW minimum code size
+            durations.append(delay)
+            delay = 100
+        else:  # Trailer
+            break
+    return durations
+
+
+def _decode_frames(
+    file: str | os.PathLike,
+    size: tuple[int, int] | None,
+) -> tuple[list[enhanced.PhotoImage], list[int]]:
+    """
+    Decode all frames of an animated image and their durations
+
+    * `file`: path of the GIF or APNG file
+    * `size`: the size to resize the frames to, default is the original size
+
+    ATTENTION:
+
+    * Without Pillow, only GIF is supported and the frames are decoded by Tk,
+    which does not compose a frame with its previous frames
+    """
+    images, durations = [], []
+    if PIL is not None:
+        with PIL.Image.open(file) as image:
+            for frame in PIL.ImageSequence.Iterator(image):
+                durations.append(int(frame.info.get("duration") or 100))
+                frame = frame.convert("RGBA")
+                if size is not None and frame.size != tuple(size):
+                    frame = frame.resize(size)
+                images.append(enhanced.PhotoImage.from_buffer(
+                    frame.tobytes(), frame.size))
+        return images, durations
+
+    with open(file, "rb") as gif:
+        durations = _gif_durations(gif.read())
+    for index in range(len(durations)):
+        frame = enhanced.PhotoImage(file=file, format=f"gif -index {index}")
+        if size is not None:
+            frame = frame.scale(size[0]/frame.width(), size[1]/frame.height())
+        images.append(frame)
+    return images, durations
+
+
+class _Frames:
+    """
+    Frames of an animated image, which are shared by all the components that
+    show the same file at the same size
+
+    The frames are decoded only once. One timer advances the frames for all
+    the visible components following the duration of each frame, and it stops
+    when no component is visible.
+    """
+
+    _cache: weakref.WeakValueDictionary[
+        tuple[str, tuple[int, int] | None], "_Frames"] = weakref.WeakValueDictionary()
+
+    def __init__(
+        self,
+        images: list[enhanced.PhotoImage],
+        durations: list[int],
+        *,
+        source: "_Frames | None" = None,
+    ) -> None:
+        """
+        * `images`: images of the frames
+        * `durations`: durations of the frames, in milliseconds
+        * `source`: the frames that these frames are scaled from
+        """
+        self.images = images
+        self.durations = durations
+        self.index: int = 0
+        self._source = source  # Keep the source alive for other variants
+        self._variants: weakref.WeakValueDictionary[
+            tuple[int, int], _Frames] = weakref.WeakValueDictionary()
+        self._components: set[AnimatedImage] = set()
+        self._root: tkinter.Tk | None = None  # not a canvas that may go away
+        self._task: str | None = None
+
+    @classmethod
+    def get(
+        cls,
+        file: str | os.PathLike,
+        size: tuple[int, int] | None = None,
+    ) -> "_Frames":
+        """
+        Return the shared frames of a file, which are decoded on a cache miss
+
+        * `file`: path of the GIF or APNG file
+        * `size`: the size to resize the frames to, default is the original size
+        """
+        key = os.path.abspath(file), None if size is None else tuple(size)
+        if (frames := cls._cache.get(key)) is None:
+            frames = cls._cache[key] = cls(*_decode_frames(file, size))
+        return frames
+
+    def size(self) -> tuple[int, int]:
+        """Return the size of the frames"""
+        return self.images[0].width(), self.images[0].height()
+
+    def scaled(self, size: tuple[int, int]) -> "_Frames":
+        """
+        Return the variant of the frames with the size, which is scaled from
+        these frames instead of being decoded again
+
+        * `size`: the size of the variant
+        """
+        if size == self.size():
+            return self
+        if (frames := self._variants.get(size)) is None:
+            width, height = self.size()
+            frames = self._variants[size] = _Frames(
+                [image.scale(size[0]/width, size[1]/height)
+                 for image in self.images], self.durations, source=self)
+            frames.index = self.index
+        return frames
+
+    def subscribe(self, component: "AnimatedImage") -> None:
+        """
+        Add a visible component and start the timer if needed
+
+        * `component`: the component that shows the frames
+        """
+        self._components.add(component)
+        if self._task is None and len(self.images) > 1 and constants.MAX_FPS != 0:
+            self._root = component.widget.master._root()
+            self._schedule()
+
+    def unsubscribe(self, component: "AnimatedImage") -> None:
+        """
+        Remove a component and stop the timer if no component is visible
+
+        * `component`: the component that shows the frames
+        """
+        self._components.discard(component)
+        if not self._components and self._task is not None:
+            tkinter.Misc.after_cancel(self._root, self._task)
+            self._task = None
+
+    def _schedule(self) -> None:
+        """Schedule the next frame after the duration of the current frame"""
+        delay = self.durations[self.index]
+        if constants.MAX_FPS:
+            delay = max(delay, 1000 // constants.MAX_FPS)
+        self._task = tkinter.Misc.after(self._root, delay, self._next)
+
+    def _next(self) -> None:
+        """Show the next frame on all the visible components"""
+        self.index = (self.index + 1) % len(self.images)
+        for component in self._components:
+            component._show(self.images[self.index])
+        self._schedule()
+
+
 class StillImage(virtual.Image):
     """A simple still image"""
 
@@ -23,3 +216,77 @@ class StillImage(virtual.Image):
         super().coords(size, position)
 
         self.widget.master.coords(self.items[0], *self.center())
+
+
+class AnimatedImage(StillImage):
+    """
+    An animated image, such as GIF and APNG
+
+    The frames are decoded once and shared by all the components that show
+    the same file, and they are played by a single timer. The animation is
+    paused while the component is hidden.
+    """
+
+    def __init__(
+        self,
+        widget: virtual.Widget,
+        relative_position: tuple[int, int] = (0, 0),
+        size: tuple[int, int] | None = None,
+        *,
+        file: str | os.PathLike,
+        image_size: tuple[int, int] | None = None,
+        name: str | None = None,
+        animation: bool = True,
+        styles: dict[str, dict[str, str]] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        * `widget`: parent widget
+        * `relative_position`: position relative to its widgets
+        * `size`: size of component
+        * `file`: path of the GIF or APNG file
+        * `image_size`: the size to resize the frames to, such as a smaller
+        size for icons, default is the original size
+        * `name`: name of component
+        * `animation`: Wether use animation to change color
+        * `styles`: style dict of component
+        * `kwargs`: extra parameters for CanvasItem
+        """
+        self._source = self._frames = _Frames.get(file, image_size)
+        StillImage.__init__(self, widget, relative_position, size,
+                            image=self._frames.images[self._frames.index],
+                            name=name, animation=animation, styles=styles, **kwargs)
+        if self.visible and self.widget.visible:
+            self._frames.subscribe(self)
+
+    def _show(self, image: enhanced.PhotoImage) -> None:
+        """Show a frame"""
+        self.image = image
+        self.widget.master.itemconfigure(self.items[0], image=image)
+
+    # @typing.override
+    def _pause(self) -> None:
+        StillImage._pause(self)
+        self._frames.unsubscribe(self)
+
+    # @typing.override
+    def _resume(self) -> None:
+        self._show(self._frames.images[self._frames.index])
+        self._frames.subscribe(self)
+
+    # @typing.override
+    def zoom(self, ratios: tuple[float, float]) -> None:
+        """Scale the image by switching to the frames of the scaled size"""
+        virtual.Component.zoom(self, ratios)
+        width, height = self._source.size()
+        ratios = self.widget.master.ratios
+        frames = self._source.scaled(
+            (max(1, round(width*ratios[0])), max(1, round(height*ratios[1]))))
+        if frames is self._frames:
+            return
+        playing = self in self._frames._components
+        self._frames.unsubscribe(self)
+        self._frames = frames
+        self._show(frames.images[frames.index])
+        if playing:
+            frames.subscribe(self)
@@ -1,10 +1,12 @@
 """All standard Texts"""
 
+import bisect
+import itertools
 import math
-import tkinter.font
 import typing
 
 from ..core import virtual
+from ..toolbox import tools
 
 __all__ = [
     "Information",
@@ -41,6 +43,7 @@ class Information(virtual.Text):
             text = text[:self.limit]
         self.text = text
         self.widget.master.itemconfigure(self.items[0], text=self.text)
+        self.widget.master._stale.add(self.widget)
 
     def append(self, text: str) -> None:
         """Append value to the value of `Text`"""
@@ -48,6 +51,7 @@ class Information(virtual.Text):
             text = self.text[:self.limit-len(self.text)]
         self.text = self.text + text
         self.widget.master.itemconfigure(self.items[0], text=self.text)
+        self.widget.master._stale.add(self.widget)
 
     def delete(self, num: int) -> None:
         """Remove a portion of the `Text` value from the trail"""
@@ -55,11 +59,13 @@ class Information(virtual.Text):
             num = len(self.text)
         self.text = self.text[:-num]
         self.widget.master.itemconfigure(self.items[0], text=self.text)
+        self.widget.master._stale.add(self.widget)
 
     def clear(self) -> None:
         """Clear the value of `Text`"""
         self.text = ""
         self.widget.master.itemconfigure(self.items[0], text=self.text)
+        self.widget.master._stale.add(self.widget)
 
 
 class SingleLineText(virtual.Text):
@@ -109,12 +115,15 @@ class SingleLineText(virtual.Text):
         """
         self.left: int = 0
         self.right: int = 0
+        self._prefix: tuple[str, tools._FontKey, list[int]] | None = None
         anchor = "w" if align == "left" else "e" if align == "right" else "center"
         virtual.Text.__init__(self, widget, relative_position, size,
                               text=text, limit=limit, show=show, placeholder=placeholder,
                               anchor=anchor, family=family, fontsize=fontsize, weight=weight,
                               slant=slant, underline=underline, overstrike=overstrike,
                               name=name, styles=styles, animation=animation, **kwargs)
+        if self.text:
+            self.set(self.text)
 
     # @typing.override
     def display(self) -> None:
@@ -153,24 +162,63 @@ class SingleLineText(virtual.Text):
             value = self.show * len(value)
         self.widget.master.itemconfigure(self.items[0], text=value)
 
-    def _text_insert(self, index: int, value: str) -> None:
-        """Insert the actual text that appears on the component"""
-        if self.show:
-            value = self.show * len(value)
-        self.widget.master.insert(self.items[0], index, value)
-
-    def _text_delete(self, start: int, end: int | typing.Literal["end"]) -> None:
-        """Delete the actual text that appears on the component"""
-        self.widget.master.dchars(self.items[0], start, end)
-
     def _text_length(self) -> int:
         """Get the length of actual text that appears on the component"""
         return self.widget.master.index(self.items[0], "end")
 
-    def _text_overflow(self) -> bool:
-        """Whether the text content extends beyond the text box"""
-        x1, y1, x2, y2 = self.widget.master.bbox(self.items[0])
-        return (x2-x1) + self.get_gap()*2 >= self.size[0]
+    def _text_visible(self) -> str:
+        """Get the visible part of the text as it appears on the component"""
+        value = self.text[self.left:self.right]
+        return self.show * len(value) if self.show else value
+
+    def _prefix_widths(self) -> list[int]:
+        """
+        Get the widths of all prefixes of the visible text, which are cached
+        until the visible text or the font changes
+        """
+        key = self.widget.master._fonts.actual(self._font_key)
+        visible = self._text_visible()
+        if self._prefix is None or self._prefix[:2] != (visible, key):
+            widths = tools._TextMetrics.get().widths(key, visible)
+            self._prefix = visible, key, [0, *itertools.accumulate(widths)]
+        return self._prefix[2]
+
+    def _fit(self, start: int, step: typing.Literal[1, -1]) -> int:
+        """
+        Return the other end of the longest slice of the text that starts
+        from `start` in the direction of `step` and fits in the text box
+
+        * `start`: the index where the slice starts
+        * `step`: 1 for extending to the right, -1 for extending to the left
+        """
+        key = self.widget.master._fonts.actual(self._font_key)
+        metrics = tools._TextMetrics.get()
+        available = self.size[0] - self.get_gap()*2
+        width, index, end = 0, start, len(self.text) if step > 0 else 0
+        while index != end:
+            glyph = self.text[index if step > 0 else index-1]
+            if (width := width + metrics.measure(key, self.show or glyph)) >= available:
+                break
+            index += step
+        return index
+
+    def _window(self, cursor: int) -> None:
+        """
+        Update the visible slice of the text, [left, right), so that the text
+        cursor is visible and the text box is filled as much as possible, and
+        then render it with a single configuration of the item
+
+        * `cursor`: the index of the text cursor in the whole text
+        """
+        self.left = min(self.left, cursor)
+        self.right = self._fit(self.left, 1)
+        if self.right < cursor:
+            self.right = cursor
+            self.left = self._fit(self.right, -1)
+        elif self.right == len(self.text) and self.left > 0:
+            self.left = self._fit(self.right, -1)
+        self._text_set(self.text[self.left:self.right])
+        self.cursor_set(cursor - self.left)
 
     def select_set(self, start: int, end: int) -> None:
         """Set the index tuple of the selected text, [start, end]"""
@@ -199,53 +247,33 @@ class SingleLineText(virtual.Text):
 
     def set(self, value: str) -> None:
         """Set text of the component"""
-        self.delete(0, self._text_length())
-        self.append(value)
+        if len(value) > self.limit:
+            value = value[:self.limit]
+        self.text, self.left = value, 0
+        self._window(len(value))
 
     def insert(self, index: int, value: str) -> None:
         """Insert text to the location of the specified index"""
         if index < 0:
             index = self._text_length() + index
+        if len(self.text) + len(value) > self.limit:
+            value = value[:self.limit-len(self.text)]
         key_index = self.left+index
         self.text = self.text[:key_index] + value + self.text[key_index:]
-        self._text_insert(index, value)
-        self.right += len(value)
-
-        if index + len(value) == self._text_length():
-            while self._text_overflow():
-                self._text_delete(0, 0)
-                self.left += 1
-        else:
-            while self._text_overflow():
-                self._text_delete(self._text_length()-1, "end")
-                self.right -= 1
+        self._window(key_index + len(value))
 
     def delete(self, start: int, end: int) -> None:
         """Delete text within the specified index range, [start, end]"""
-        if self._text_length() == 0:
+        if not self.text:
             return None
-        self.text = self.text[:self.left+start] + self.text[self.left+end+1:]
-        self._text_delete(start, end)
-        self.right -= end - start + 1
-
-        if self.right != len(self.text):
-            while not self._text_overflow():
-                if self.right == len(self.text):
-                    return
-                self._text_insert(self._text_length(), self.text[self.right])
-                self.right += 1
-
-            self._text_delete(self._text_length()-1, "end")
-            self.right -= 1
-        elif self.left > 0:
-            while not self._text_overflow():
-                if self.left == 0:
-                    return
-                self._text_insert(0, self.text[self.left])
-                self.left -= 1
-
-            self._text_delete(0, 0)
-            self.left += 1
+        cursor = self.left + self.cursor_get()
+        start, end = self.left + start, self.left + end
+        self.text = self.text[:start] + self.text[end+1:]
+        if cursor > end:
+            cursor -= end - start + 1
+        elif cursor > start:
+            cursor = start
+        self._window(cursor)
 
     def pop(self) -> None:
         """Delete a character at the text cursor"""
@@ -259,34 +287,20 @@ class SingleLineText(virtual.Text):
 
     def get_gap(self) -> float:
         """Get the size of the spacing between the text and the border"""
-        if self.items:  # XXX: Maybe need to be optimized?
-            x1, y1, x2, y2 = self.widget.master.bbox(self.items[0])
-            return (self.size[1] - (y2-y1)) // 2
-        return (self.size[1] - abs(self.font.cget("size"))) // 2
+        key = self.widget.master._fonts.actual(self._font_key)
+        return (self.size[1] - tools._TextMetrics.get().linespace(key)) // 2
 
     def _move_left(self) -> None:
         """Move the text to the left as a whole, i.e. press the right arrow"""
         if self.right == len(self.text):
             return
-        self._text_insert(length := self._text_length(), self.text[self.right])
-        self.right += 1
-        self.cursor_set(length+1)
-
-        while self._text_overflow():
-            self._text_delete(0, 0)
-            self.left += 1
+        self._window(self.right + 1)
 
     def _move_right(self) -> None:
         """Move the text to the right as a whole, i.e. press the left arrow"""
         if self.left == 0:
             return
-        self.left -= 1
-        self._text_insert(0, self.text[self.left])
-        self.cursor_set(0)
-
-        while self._text_overflow():
-            self._text_delete(self._text_length()-1, "end")
-            self.right -= 1
+        self._window(self.left - 1)
 
     def cursor_get(self) -> int:
         """Get the index position of the text cursor"""
@@ -301,19 +315,16 @@ class SingleLineText(virtual.Text):
     def cursor_find(self, x: int) -> int:
         """Return the index of text with the x position of mouse"""
         x1, y1, x2, y2 = self.widget.master.bbox(self.items[0])
-        if x <= x1 or self._text_length() == 0:
+        prefix = self._prefix_widths()
+        if x <= x1 or len(prefix) == 1:
             return 0
         if x >= x2:
-            return self._text_length()
-        actual_text = self._text_get()
-        avg_half_width = (x2-x1)/self._text_length()/2
-        font = tkinter.font.Font(
-            font=self.widget.master.itemcget(self.items[0], "font"))
-        for i in range(len(actual_text)):
-            dx = font.measure(actual_text[:i])
-            if x1 + dx + avg_half_width > x:
-                return i
-        return self._text_length()  # Without this, some error will be thrown
+            return len(prefix) - 1
+        dx = x - x1
+        index = min(bisect.bisect_left(prefix, dx), len(prefix) - 1)
+        if index > 0 and dx - prefix[index-1] < prefix[index] - dx:
+            index -= 1  # The previous boundary is closer to the mouse
+        return index
 
     def cursor_move(self, count: int) -> None:
         """Move the index position of the text cursor"""
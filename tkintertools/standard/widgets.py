@@ -1,5 +1,6 @@
 """All standard Widgets"""
 
+import concurrent.futures
 import itertools
 import math
 import typing
@@ -109,12 +110,11 @@ class Image(virtual.Widget):
         """
         virtual.Widget.__init__(self, master, position, (0, 0),
                                 name=name, through=through, animation=animation)
-        if image is not None:
-            if size is None:
-                images.StillImage(self, image=image)
-            else:
-                images.StillImage(self, image=image.scale(
-                    size[0]/image.width(), size[1]/image.height()))
+        self._future: concurrent.futures.Future | None = None
+        if image is not None and size is not None:
+            image = enhanced._scaled_images.get(
+                image, size[0]/image.width(), size[1]/image.height())
+        images.StillImage(self, image=image)
 
     def get(self) -> enhanced.PhotoImage:
         """Get the image of the widget"""
@@ -124,11 +124,37 @@ class Image(virtual.Widget):
 
     def set(self, image: enhanced.PhotoImage | None) -> None:
         """Set the image of the widget"""
+        self._future = None  # The image being loaded is replaced
         self._images[0]._initail_image = image
         if image is not None:
-            image = image.scale(*self.master.ratios)
+            image = enhanced._scaled_images.get(image, *self.master.ratios)
         self._images[0].image = image
-        self.master.itemconfigure(self._images[0].items[0], image=image)
+        self.master.itemconfigure(
+            self._images[0].items[0], image="" if image is None else image)
+
+    def load(
+        self,
+        file: str,
+        size: tuple[int, int] | None = None,
+        *,
+        placeholder: enhanced.PhotoImage | None = None,
+    ) -> concurrent.futures.Future:
+        """
+        Load the image of the widget from a file in the background, and return
+        the future of the load
+
+        * `file`: path of the image file
+        * `size`: the size to resize the image to, default is the original size
+        * `placeholder`: the image shown until the image is loaded
+        """
+        def callback(image: enhanced.PhotoImage) -> None:
+            if self._future is future and self._images:  # Not replaced or destroyed
+                self.set(image)
+
+        self.set(placeholder)
+        future = self._future = enhanced.load_image(
+            file, size, callback=callback, master=self.master)
+        return future
 
 
 class Label(virtual.Widget):
@@ -174,7 +200,7 @@ class Label(virtual.Widget):
         * `animation`: wether enable animation
         """
         if size is None:
-            size = tools.get_text_size(text, family, fontsize, padding=10)
+            size = tools.get_text_size(text, fontsize, family, padding=10)
         virtual.Widget.__init__(self, master, position, size,
                                 name=name, through=through, animation=animation)
         if constants.SYSTEM == "Windows10":
@@ -234,7 +260,7 @@ class Button(virtual.Widget):
         * `animation`: wether enable animation
         """
         if size is None:
-            size = tools.get_text_size(text, family, fontsize, padding=10)
+            size = tools.get_text_size(text, fontsize, family, padding=10)
         virtual.Widget.__init__(self, master, position, size,
                                 name=name, through=through, animation=animation)
         if constants.SYSTEM == "Windows10":
@@ -305,7 +331,8 @@ class Switch(virtual.Widget):
             f"{self.state.split('-')[0]}-{'on' if value else 'off'}", no_delay=True)
         dx = self._shapes[0].size[0]/2 if value else -self._shapes[0].size[0]/2
         animations.MoveComponent(
-            self._shapes[1], 250, (dx, 0), controller=controllers.smooth, fps=60).start()
+            self._shapes[1], 250, (dx, 0), controller=controllers.smooth,
+            fps=60, skip=True).start()
 
 
 class InputBox(virtual.Widget):
@@ -353,7 +380,7 @@ class InputBox(virtual.Widget):
         """
         if size is None:
             size = 200, tools.get_text_size(
-                "", family, fontsize, padding=10)[1]
+                "", fontsize, family, padding=10)[1]
         virtual.Widget.__init__(self, master, position, size,
                                 name=name, through=through, animation=animation)
         if constants.SYSTEM == "Windows10":
@@ -492,7 +519,7 @@ class ToggleButton(virtual.Widget):
         * `animation`: wether enable animation
         """
         if size is None:
-            size = tools.get_text_size(text, family, fontsize, padding=10)
+            size = tools.get_text_size(text, fontsize, family, padding=10)
         virtual.Widget.__init__(self, master, position, size, state="normal-off",
                                 name=name, through=through, animation=animation)
         if constants.SYSTEM == "Windows10":
@@ -789,7 +816,7 @@ class IconButton(virtual.Widget):
         * `animation`: wether enable animation
         """
         if size is None:
-            size = tools.get_text_size(text, family, fontsize, padding=10)
+            size = tools.get_text_size(text, fontsize, family, padding=10)
             size = size[0] + size[1] - 10, size[1]
         virtual.Widget.__init__(self, master, position, size,
                                 name=name, through=through, animation=animation)
@@ -931,10 +958,10 @@ class SegmentedButton(virtual.Widget):
         if not sizes:
             if texts:
                 sizes = tuple(tools.get_text_size(
-                    text, family, fontsize, padding=10) for text in texts)
+                    text, fontsize, family, padding=10) for text in texts)
             else:
                 sizes = (tools.get_text_size(
-                    "", family, fontsize, padding=5),)
+                    "", fontsize, family, padding=5),)
         widths, heights, length = *zip(*sizes), len(sizes)
         if not texts:
             sizes, length = (), 0
@@ -1024,7 +1051,7 @@ class SpinBox(virtual.Widget):
         """
         if size is None:
             size = 200, tools.get_text_size(
-                "", family, fontsize, padding=10)[1]
+                "", fontsize, family, padding=10)[1]
         virtual.Widget.__init__(self, master, position, size,
                                 name=name, through=through, animation=animation)
         InputBox(self, (0, 0), size, family=family, fontsize=fontsize, weight=weight,
@@ -1,49 +1,389 @@
 """Enhanced versions of some tkinter classes and functions"""
 
+import base64
+import collections
+import concurrent.futures
+import fractions
 import functools
+import os
+import struct
 import tkinter
+import typing
+import warnings
+import weakref
+import zlib
 
 try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import PIL.Image as Image
     import PIL.ImageTk as ImageTk
 except ImportError:
-    ImageTk = None
+    Image = ImageTk = None
+
+from ..core import constants
 
 __all__ = [
     "PhotoImage",
+    "load_image",
 ]
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    """The Paeth predictor of PNG"""
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _unfilter(
+    raw: bytes,
+    width: int,
+    height: int,
+    channels: int,
+) -> bytearray:
+    """
+    Reverse the filters of the scanlines of PNG
+
+    * `raw`: decompressed scanlines, each starts with its filter type
+    * `width`: width of the image
+    * `height`: height of the image
+    * `channels`: number of bytes of a pixel
+    """
+    stride = width*channels
+    pixels = bytearray(stride*height)
+    previous = bytearray(stride)
+    for y in range(height):
+        start = y*(stride+1)
+        kind, line = raw[start], bytearray(raw[start+1:start+1+stride])
+        if kind == 1:
+            for i in range(channels, stride):
+                line[i] = (line[i] + line[i-channels]) & 0xFF
+        elif kind == 2:
+            for i in range(stride):
+                line[i] = (line[i] + previous[i]) & 0xFF
+        elif kind == 3:
+            for i in range(stride):
+                left = line[i-channels] if i >= channels else 0
+                line[i] = (line[i] + (left + previous[i]) // 2) & 0xFF
+        elif kind == 4:
+            for i in range(stride):
+                left = line[i-channels] if i >= channels else 0
+                upper_left = previous[i-channels] if i >= channels else 0
+                line[i] = (line[i] + _paeth(left, previous[i], upper_left)) & 0xFF
+        pixels[y*stride:(y+1)*stride] = previous = line
+    return pixels
+
+
+def _decode_png(data: bytes) -> tuple[int, int, int, bytes]:
+    """
+    Decode PNG data written by Tk, return the width, height, number of
+    channels and pixels of the image
+
+    * `data`: 8-bit, non-interlaced, RGB or RGBA PNG data
+    """
+    if not data.startswith(_PNG_SIGNATURE):
+        raise ValueError("The data is not PNG data.")
+    position, chunks = len(_PNG_SIGNATURE), []
+    while position < len(data):
+        length, kind = struct.unpack(">I4s", data[position:position+8])
+        body = data[position+8:position+8+length]
+        if kind == b"IHDR":
+            width, height, depth, color, _, _, interlace = struct.unpack(
+                ">IIBBBBB", body)
+            if depth != 8 or color not in (2, 6) or interlace:
+                raise ValueError("Only 8-bit non-interlaced RGB or RGBA PNG "
+                                 "data is supported.")
+        elif kind == b"IDAT":
+            chunks.append(body)
+        elif kind == b"IEND":
+            break
+        position += length + 12
+    channels = 4 if color == 6 else 3
+    raw = zlib.decompress(b"".join(chunks))
+    stride = width*channels + 1
+    if not any(raw[i*stride] for i in range(height)):  # Tk writes no filters
+        return width, height, channels, b"".join(
+            raw[i*stride+1:(i+1)*stride] for i in range(height))
+    return width, height, channels, bytes(
+        _unfilter(raw, width, height, channels))
+
+
+def _encode_png(
+    width: int,
+    height: int,
+    channels: typing.Literal[3, 4],
+    pixels: bytes,
+) -> bytes:
+    """
+    Encode pixels to PNG data quickly, the scanlines are neither filtered nor
+    compressed, since the data is only used to pass the pixels to Tk
+
+    * `width`: width of the image
+    * `height`: height of the image
+    * `channels`: 3 for RGB and 4 for RGBA
+    * `pixels`: pixels of the image, row by row
+    """
+    def chunk(kind: bytes, body: bytes) -> bytes:
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(
+            ">I", zlib.crc32(kind + body))
+
+    stride = width*channels
+    raw = b"".join(b"\x00" + pixels[i*stride:(i+1)*stride]
+                   for i in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8,
+                         6 if channels == 4 else 2, 0, 0, 0)
+    return _PNG_SIGNATURE + chunk(b"IHDR", header) + chunk(
+        b"IDAT", zlib.compress(raw, 0)) + chunk(b"IEND", b"")
+
+
+def _buffer(
+    buffer: "bytes | bytearray | memoryview | numpy.ndarray",
+    size: tuple[int, int] | None,
+) -> tuple[tuple[int, int], int, memoryview]:
+    """
+    Return the size, number of channels and bytes of a buffer of pixels
+
+    * `buffer`: a contiguous uint8 buffer of RGB or RGBA pixels, row by row
+    * `size`: size of the image, it can be omitted for an array of the shape
+    (height, width, channels)
+    """
+    if numpy is not None and isinstance(buffer, numpy.ndarray):
+        if size is None and buffer.ndim == 3:
+            size = buffer.shape[1], buffer.shape[0]
+        if buffer.dtype != numpy.uint8:
+            raise ValueError(
+                f"The array must be of uint8, not {buffer.dtype}.")
+        buffer = numpy.ascontiguousarray(buffer)
+    if size is None:
+        raise ValueError("The size of the image is required.")
+    view = memoryview(buffer).cast("B")
+    channels, remainder = divmod(len(view), size[0]*size[1])
+    if remainder or channels not in (3, 4):
+        raise ValueError(
+            f"The buffer does not contain RGB or RGBA pixels of {size}.")
+    return size, channels, view
+
+
+def _encode(
+    size: tuple[int, int],
+    channels: int,
+    view: memoryview,
+) -> tuple[bytes, str]:
+    """
+    Return the binary data and its format that Tk reads the pixels from, PPM
+    for RGB pixels and PNG for RGBA pixels
+
+    * `size`: size of the image
+    * `channels`: 3 for RGB and 4 for RGBA
+    * `view`: bytes of the pixels
+    """
+    if channels == 3:
+        return b"P6\n%d %d\n255\n" % size + view, "ppm"
+    return _encode_png(*size, 4, view), "png"
+
+
+def _ratio(
+    ratio: float,
+    size: int,
+    target: int,
+    *,
+    limit: int = 16,
+) -> fractions.Fraction | None:
+    """
+    Return the integer factor or the reciprocal of an integer factor that
+    scales the size to the target size as the ratio does, or `None` if there
+    is no such fraction
+
+    * `ratio`: the zoom ratio
+    * `size`: the original size
+    * `target`: the target size
+    * `limit`: the maximum factor
+
+    ATTENTION:
+
+    * Tk subsamples before it zooms, so a fraction such as 9/10 would keep one
+    pixel in ten and repeat it nine times. Only `n/1` and `1/n` are exact
+    """
+    fraction = fractions.Fraction(ratio).limit_denominator(limit)
+    if fraction > 0 and fraction.numerator <= limit \
+            and 1 in (fraction.numerator, fraction.denominator) \
+            and round(fraction*size) == target:
+        return fraction
+    return None
+
+
+def _resample_numpy(
+    pixels: bytes,
+    size: tuple[int, int],
+    channels: int,
+    target: tuple[int, int],
+    resample: typing.Literal["nearest", "bilinear"],
+) -> bytes:
+    """
+    Resample the pixels with NumPy, the alpha channel is premultiplied for
+    bilinear resampling so that transparent pixels do not bleed their colors
+
+    * `pixels`: pixels of the image, row by row
+    * `size`: the original size
+    * `channels`: number of bytes of a pixel
+    * `target`: the target size
+    * `resample`: the resampling mode
+    """
+    array = numpy.frombuffer(pixels, numpy.uint8).reshape(
+        size[1], size[0], channels)
+    if resample == "nearest":
+        xs = numpy.minimum(
+            (numpy.arange(target[0])*size[0]/target[0]).astype(int), size[0]-1)
+        ys = numpy.minimum(
+            (numpy.arange(target[1])*size[1]/target[1]).astype(int), size[1]-1)
+        return array[ys[:, None], xs[None, :]].tobytes()
+
+    def axis(n: int, m: int) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        position = numpy.clip((numpy.arange(m)+0.5)*n/m - 0.5, 0, n-1)
+        lower = position.astype(int)
+        return lower, numpy.minimum(lower+1, n-1), position - lower
+
+    array = array.astype(numpy.float32)
+    if channels == 4:
+        array[..., :3] *= array[..., 3:] / 255
+    x0, x1, dx = axis(size[0], target[0])
+    y0, y1, dy = axis(size[1], target[1])
+    dx, dy = dx[None, :, None], dy[:, None, None]
+    array = array[:, x0]*(1-dx) + array[:, x1]*dx  # Separable, x first
+    result = array[y0]*(1-dy) + array[y1]*dy
+    if channels == 4:
+        alpha = result[..., 3:]
+        numpy.divide(result[..., :3]*255, alpha,
+                     out=result[..., :3], where=alpha > 0)
+    return numpy.clip(numpy.rint(result), 0, 255).astype(numpy.uint8).tobytes()
+
+
+def _resample_python(
+    pixels: bytes,
+    size: tuple[int, int],
+    channels: int,
+    target: tuple[int, int],
+) -> bytes:
+    """
+    Resample the pixels with the nearest neighbor in pure Python
+
+    * `pixels`: pixels of the image, row by row
+    * `size`: the original size
+    * `channels`: number of bytes of a pixel
+    * `target`: the target size
+    """
+    stride = size[0]*channels
+    columns = [min(i*size[0]//target[0], size[0]-1)*channels
+               for i in range(target[0])]
+    rows = {}
+    for j in range(target[1]):
+        y = min(j*size[1]//target[1], size[1]-1)
+        if y not in rows:
+            line = pixels[y*stride:(y+1)*stride]
+            rows[y] = b"".join(line[x:x+channels] for x in columns)
+    return b"".join(rows[min(j*size[1]//target[1], size[1]-1)]
+                    for j in range(target[1]))
+
 
 class PhotoImage(tkinter.PhotoImage):
     """Enhanced version of `tkinter.PhotoImage`"""
 
-    @functools.cached_property
-    def _data(self) -> list[list[str]]:
-        """Return image data in the form of a string"""
-        # self.tk.call(self, "data", "-format", "png -alpha 0")
-        # XXX: Add alpha channel
-        return [line.split() for line in self.tk.call(self, "data")]
+    @classmethod
+    def from_buffer(
+        cls,
+        buffer: "bytes | bytearray | memoryview | numpy.ndarray",
+        size: tuple[int, int] | None = None,
+    ) -> "PhotoImage":
+        """
+        Create a PhotoImage from a buffer of pixels
+
+        * `buffer`: a contiguous uint8 buffer of RGB or RGBA pixels, row by row,
+        such as `bytes`, `memoryview` or a NumPy array
+        * `size`: size of the image, it can be omitted for an array of the shape
+        (height, width, channels)
+
+        The pixels are passed to Tk as binary PPM or PNG data, without any
+        formatting per pixel.
+        """
+        data, format_ = _encode(*_buffer(buffer, size))
+        return cls(data=data, format=format_)
+
+    def put_buffer(
+        self,
+        buffer: "bytes | bytearray | memoryview | numpy.ndarray",
+        size: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        Update the PhotoImage with a buffer of pixels, which is fast enough to
+        show frames that change over time
+
+        * `buffer`: a contiguous uint8 buffer of RGB or RGBA pixels, row by row,
+        such as `bytes`, `memoryview` or a NumPy array
+        * `size`: size of the image, it can be omitted for an array of the shape
+        (height, width, channels)
+
+        ATTENTION:
 
-    @functools.cached_property
-    def _transparency_data(self) -> list[list[bool]]:
-        """Return transparency data of the image"""
-        return [[self.transparency_get(x, y)
-                 for x in range(self.width())]
-                for y in range(self.height())]
+        * The scaled images of the PhotoImage are not updated
+        """
+        data, format_ = _encode(*_buffer(buffer, size))
+        self.tk.call(self, "put", data, "-format", format_)
 
-    def scale(self, x: float, y: float) -> "PhotoImage":
-        """Scale the PhotoImage"""
-        width = round(x*self.width())
-        height = round(y*self.height())
-        new_image = PhotoImage(width=width, height=height)
-        new_image.put([[self._data[int(j/y)][int(i/x)]
-                      for i in range(width)] for j in range(height)])
+    def _pixels(self) -> tuple[int, int, int, bytes]:
+        """Return the width, height, number of channels and pixels"""
+        data = self.tk.call(self, "data", "-format", "png")
+        if isinstance(data, str):
+            data = data.encode("latin-1") if data.startswith("\x89PNG") \
+                else base64.b64decode(data)
+        return _decode_png(data)
 
-        for i in range(width):
-            for j in range(height):
-                if self._transparency_data[int(j/y)][int(i/x)]:
-                    new_image.transparency_set(i, j, True)
+    def scale(
+        self,
+        x: float,
+        y: float,
+        *,
+        resample: typing.Literal["nearest", "bilinear"] | None = None,
+    ) -> "PhotoImage":
+        """
+        Scale the PhotoImage
 
-        return new_image
+        * `x`: zoom ratio of the width
+        * `y`: zoom ratio of the height
+        * `resample`: resampling mode, default is the nearest neighbor
+
+        Integer factors and their reciprocals are scaled natively by Tk, and
+        the others are resampled over the raw pixels with NumPy. Without
+        NumPy, the nearest neighbor is always used.
+        """
+        width = max(1, round(x*self.width()))
+        height = max(1, round(y*self.height()))
+
+        if resample in (None, "nearest") and \
+                (ratio_x := _ratio(x, self.width(), width)) is not None and \
+                (ratio_y := _ratio(y, self.height(), height)) is not None:
+            new_image = PhotoImage(width=width, height=height)
+            new_image.tk.call(
+                new_image, "copy", self,
+                "-zoom", ratio_x.numerator, ratio_y.numerator,
+                "-subsample", ratio_x.denominator, ratio_y.denominator)
+            return new_image
+
+        size_x, size_y, channels, pixels = self._pixels()
+        if numpy is not None:
+            pixels = _resample_numpy(pixels, (size_x, size_y), channels,
+                                     (width, height), resample or "nearest")
+        else:
+            pixels = _resample_python(
+                pixels, (size_x, size_y), channels, (width, height))
+        return PhotoImage.from_buffer(pixels, (width, height))
 
 
 if ImageTk is not None:
@@ -51,8 +391,278 @@ if ImageTk is not None:
     class PhotoImage(ImageTk.PhotoImage, tkinter.PhotoImage):
         """Pillow version of `tkinter.PhotoImage`"""
 
-        def scale(self, x: float, y: float) -> "PhotoImage":
-            """Scale the PhotoImage"""
-            width = round(x*self.width())
-            height = round(y*self.height())
-            return PhotoImage(ImageTk.getimage(self).resize((width, height)))
+        @classmethod
+        def from_buffer(
+            cls,
+            buffer: "bytes | bytearray | memoryview | numpy.ndarray",
+            size: tuple[int, int] | None = None,
+        ) -> "PhotoImage":
+            """
+            Create a PhotoImage from a buffer of pixels
+
+            * `buffer`: a contiguous uint8 buffer of RGB or RGBA pixels, row by
+            row, such as `bytes`, `memoryview` or a NumPy array
+            * `size`: size of the image, it can be omitted for an array of the
+            shape (height, width, channels)
+            """
+            size, channels, view = _buffer(buffer, size)
+            mode = "RGBA" if channels == 4 else "RGB"
+            return cls(Image.frombuffer(mode, size, view, "raw", mode, 0, 1))
+
+        def put_buffer(
+            self,
+            buffer: "bytes | bytearray | memoryview | numpy.ndarray",
+            size: tuple[int, int] | None = None,
+        ) -> None:
+            """
+            Update the PhotoImage with a buffer of pixels
+
+            * `buffer`: a contiguous uint8 buffer of RGB or RGBA pixels, row by
+            row, such as `bytes`, `memoryview` or a NumPy array
+            * `size`: size of the image, it can be omitted for an array of the
+            shape (height, width, channels)
+            """
+            size, channels, view = _buffer(buffer, size)
+            mode = "RGBA" if channels == 4 else "RGB"
+            self.paste(Image.frombuffer(mode, size, view, "raw", mode, 0, 1))
+
+        def scale(
+            self,
+            x: float,
+            y: float,
+            *,
+            resample: typing.Literal["nearest", "bilinear"] | None = None,
+        ) -> "PhotoImage":
+            """
+            Scale the PhotoImage
+
+            * `x`: zoom ratio of the width
+            * `y`: zoom ratio of the height
+            * `resample`: resampling mode, default is the one of Pillow
+            """
+            width = max(1, round(x*self.width()))
+            height = max(1, round(y*self.height()))
+            if resample is None:
+                return PhotoImage(
+                    ImageTk.getimage(self).resize((width, height)))
+            return PhotoImage(ImageTk.getimage(self).resize(
+                (width, height), resample={"nearest": Image.NEAREST,
+                                           "bilinear": Image.BILINEAR}[resample]))
+
+
+class _ScaledImages:
+    """
+    Process-wide LRU cache of scaled images
+
+    The scaled images are keyed by the name of the source image, the target
+    size, i.e. the zoom ratio quantized to whole pixels, and the resampling
+    mode, so that components with the same image share the scaled images.
+    The total size of the cached images is kept within the memory budget
+    `constants.IMAGE_CACHE`, and the least recently used ones are evicted.
+
+    ATTENTION:
+
+    * The scaled images are shared, so they should not be modified
+    * Modifying the source image does not update the cached images
+    """
+
+    def __init__(self) -> None:
+        self._images: collections.OrderedDict[
+            tuple[str, int, int, str | None], PhotoImage] = collections.OrderedDict()
+        self._bytes: int = 0
+
+    def get(
+        self,
+        image: PhotoImage,
+        x: float,
+        y: float,
+        *,
+        resample: typing.Literal["nearest", "bilinear"] | None = None,
+    ) -> PhotoImage:
+        """
+        Return the scaled image, which is scaled only on a cache miss
+
+        * `image`: the source image
+        * `x`: zoom ratio of the width
+        * `y`: zoom ratio of the height
+        * `resample`: resampling mode
+        """
+        width = max(1, round(x*image.width()))
+        height = max(1, round(y*image.height()))
+        if (width, height) == (image.width(), image.height()):
+            return image
+        key = str(image), width, height, resample
+        if (scaled := self._images.get(key)) is not None:
+            self._images.move_to_end(key)
+            return scaled
+        scaled = self._images[key] = image.scale(x, y, resample=resample)
+        self._bytes += width*height*4
+        while self._bytes > constants.IMAGE_CACHE and self._images:
+            (_, width, height, _), _ = self._images.popitem(last=False)
+            self._bytes -= width*height*4
+        return scaled
+
+    def clear(self) -> None:
+        """Remove all scaled images"""
+        self._images.clear()
+        self._bytes = 0
+
+
+_scaled_images = _ScaledImages()
+
+
+def _decode(
+    file: str | os.PathLike,
+    size: tuple[int, int] | None,
+) -> tuple[tuple[int, int], bytes]:
+    """
+    Decode and resize an image file with Pillow, which runs in a worker and
+    returns the size and RGBA pixels of the image
+
+    * `file`: path of the image file
+    * `size`: the size to resize the image to
+    """
+    with Image.open(file) as image:
+        image = image.convert("RGBA")
+        if size is not None and image.size != tuple(size):
+            image = image.resize(size)
+        return image.size, image.tobytes()
+
+
+@functools.cache
+def _executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the default pool of workers that decode images"""
+    return concurrent.futures.ThreadPoolExecutor(
+        thread_name_prefix="tkintertools-image")
+
+
+class _ImageLoader:
+    """
+    Loader of image files in the background
+
+    Files are decoded and resized by Pillow in a pool of workers, which only
+    hand raw buffers of pixels back. Tk is not thread-safe, so one timer on
+    the main thread polls the finished loads and creates their `PhotoImage`.
+    Without Pillow, the files are decoded by Tk on the main thread instead.
+    """
+
+    _instances: weakref.WeakKeyDictionary[tkinter.Misc, "_ImageLoader"] = \
+        weakref.WeakKeyDictionary()
+
+    def __init__(self, root: tkinter.Misc, *, interval: int = 15) -> None:
+        """
+        * `root`: the root window that the images belong to
+        * `interval`: interval of polling the finished loads, in milliseconds
+        """
+        self._root = weakref.ref(root)  # Not to keep the key of _instances alive
+        self._interval = interval
+        self._pending: list[tuple[concurrent.futures.Future, str | os.PathLike,
+                                  tuple[int, int] | None,
+                                  typing.Callable[[PhotoImage], typing.Any]]] = []
+        self._task: str | None = None
+
+    @classmethod
+    def get(cls, root: tkinter.Misc | None = None) -> "_ImageLoader":
+        """
+        Return the loader of the root window
+
+        * `root`: the root window, default is the default root window
+        """
+        if root is None:
+            root = tkinter._get_default_root("load images")
+        if (loader := cls._instances.get(root)) is None:
+            loader = cls._instances[root] = cls(root)
+        return loader
+
+    def load(
+        self,
+        file: str | os.PathLike,
+        size: tuple[int, int] | None,
+        callback: typing.Callable[[PhotoImage], typing.Any],
+        executor: concurrent.futures.Executor | None,
+    ) -> concurrent.futures.Future:
+        """
+        Start to load an image file
+
+        * `file`: path of the image file
+        * `size`: the size to resize the image to
+        * `callback`: the function that is called with the image on the main
+        thread
+        * `executor`: the pool of workers
+        """
+        if Image is None:
+            future = concurrent.futures.Future()
+            future.set_result(None)  # Tk will decode it on the main thread
+        else:
+            future = (executor or _executor()).submit(_decode, file, size)
+        self._pending.append((future, file, size, callback))
+        if self._task is None and (root := self._root()) is not None:
+            self._task = root.after(self._interval, self._poll)
+        return future
+
+    def _poll(self) -> None:
+        """Finish the loads that are done and keep polling the others"""
+        self._task = None
+        done = [entry for entry in self._pending if entry[0].done()]
+        for entry in done:
+            self._pending.remove(entry)
+        try:
+            while done:
+                self._finish(*done.pop(0))
+        finally:
+            self._pending += done  # Left behind by an error of a callback
+            if self._pending and (root := self._root()) is not None:
+                self._task = root.after(self._interval, self._poll)
+
+    def _finish(
+        self,
+        future: concurrent.futures.Future,
+        file: str | os.PathLike,
+        size: tuple[int, int] | None,
+        callback: typing.Callable[[PhotoImage], typing.Any],
+    ) -> None:
+        """Create the image of a finished load and call its callback"""
+        if future.cancelled():
+            return
+        try:
+            if (result := future.result()) is None:
+                image = PhotoImage(file=file)
+                if size is not None:
+                    image = image.scale(
+                        size[0]/image.width(), size[1]/image.height())
+            else:
+                image = PhotoImage.from_buffer(result[1], result[0])
+        except Exception as error:  # Raised by Pillow in a worker or by Tk
+            return warnings.warn(
+                f"Failed to load image {file!r}: {error}", UserWarning)
+        callback(image)
+
+
+def load_image(
+    file: str | os.PathLike,
+    size: tuple[int, int] | None = None,
+    *,
+    callback: typing.Callable[[PhotoImage], typing.Any],
+    executor: concurrent.futures.Executor | None = None,
+    master: tkinter.Misc | None = None,
+) -> concurrent.futures.Future:
+    """
+    Load an image file in the background without blocking the main loop, and
+    return the future of the load, which can be cancelled
+
+    * `file`: path of the image file
+    * `size`: the size to resize the image to, default is the original size
+    * `callback`: the function that is called with the loaded `PhotoImage` on
+    the main thread
+    * `executor`: the pool of workers that decode the image, such as a
+    `concurrent.futures.ProcessPoolExecutor`, default is a shared thread pool
+    * `master`: the widget that the image belongs to, default is the default
+    root window
+
+    ATTENTION:
+
+    * The image is decoded by Pillow, without Pillow, it is decoded by Tk on
+    the main thread
+    """
+    root = master._root() if master is not None else None
+    return _ImageLoader.get(root).load(file, size, callback, executor)
@@ -1,14 +1,17 @@
 """Some useful utility classes or utility functions"""
 
 import atexit
+import collections
 import ctypes
 import os
 import platform
+import re
 import shutil
 import tkinter
 import tkinter.font
 import typing
 import warnings
+import weakref
 
 from ..core import constants
 
@@ -18,10 +21,20 @@ __all__ = [
     "load_font",
     "screen_size",
     "get_text_size",
+    "get_line_height",
 ]
 
 _LINUX_FONTS_DIR = os.path.expanduser("~/.fonts/")
 
+_FULL_WIDTH = re.compile(
+    "[\u2e80-\u3029\u3030-\u303e\u3041-\u3098\u309b-\u33ff\u3400-\u4dbf"
+    "\u4e00-\u9fff\uac00-\ud7a3\uf900-\ufaff\ufe30-\ufe4f\uff01-\uff60"
+    "\uffe0-\uffe6]+")
+"""
+Runs of full-width CJK characters, which have a constant advance per font,
+without the combining marks of zero width in U+302A-U+302F and U+3099-U+309A
+"""
+
 
 class _Trigger:
     """
@@ -67,6 +80,313 @@ class _Trigger:
             self._command(*args, **kwargs)
 
 
+class _SpatialIndex:
+    """
+    Uniform grid spatial index
+
+    The bounding box of each key is recorded in every cell of the grid that it
+    overlaps, so a point query only needs to check the keys of one cell.
+    Keys whose bounding box covers too many cells are kept in a separate list
+    and are checked on every query.
+    """
+
+    def __init__(self, cell: int = 64, *, max_cells: int = 256) -> None:
+        """
+        * `cell`: the side length of a cell of the grid
+        * `max_cells`: the maximum number of cells that a key can occupy
+        """
+        self._cell = cell
+        self._max_cells = max_cells
+        self._boxes: dict[typing.Hashable,
+                          tuple[float, float, float, float]] = {}
+        self._cells: dict[tuple[int, int], set[typing.Hashable]] = {}
+        self._large: set[typing.Hashable] = set()
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self._boxes
+
+    def _span(
+        self,
+        box: tuple[float, float, float, float],
+    ) -> tuple[range, range]:
+        """Return the range of cells that the bounding box overlaps"""
+        x1, y1, x2, y2 = box
+        return (range(int(x1 // self._cell), int(x2 // self._cell) + 1),
+                range(int(y1 // self._cell), int(y2 // self._cell) + 1))
+
+    def insert(
+        self,
+        key: typing.Hashable,
+        box: tuple[float, float, float, float],
+    ) -> None:
+        """
+        Insert a key or update its bounding box
+
+        * `key`: the key
+        * `box`: the bounding box of the key, (x1, y1, x2, y2)
+        """
+        self.remove(key)
+        self._boxes[key] = box
+        xs, ys = self._span(box)
+        if len(xs) * len(ys) > self._max_cells:
+            self._large.add(key)
+            return
+        for i in xs:
+            for j in ys:
+                self._cells.setdefault((i, j), set()).add(key)
+
+    def remove(self, key: typing.Hashable) -> None:
+        """
+        Remove a key, nothing happens if the key does not exist
+
+        * `key`: the key
+        """
+        if (box := self._boxes.pop(key, None)) is None:
+            return
+        if key in self._large:
+            return self._large.discard(key)
+        xs, ys = self._span(box)
+        for i in xs:
+            for j in ys:
+                if (keys := self._cells.get((i, j))) is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._cells[i, j]
+
+    def query(self, x: float, y: float) -> list[typing.Hashable]:
+        """
+        Return all keys whose bounding box contains the point
+
+        * `x`: x-coordinate of the point
+        * `y`: y-coordinate of the point
+        """
+        cell = int(x // self._cell), int(y // self._cell)
+        result: list[typing.Hashable] = []
+        for keys in self._cells.get(cell, ()), self._large:
+            for key in keys:
+                x1, y1, x2, y2 = self._boxes[key]
+                if x1 <= x <= x2 and y1 <= y <= y2:
+                    result.append(key)
+        return result
+
+    def clear(self) -> None:
+        """Remove all keys"""
+        self._boxes.clear()
+        self._cells.clear()
+        self._large.clear()
+
+
+class _FontKey(typing.NamedTuple):
+    """Options of a font in `_FontPool`, the size is the initial size"""
+
+    family: str
+    size: int
+    weight: typing.Literal["normal", "bold"]
+    slant: typing.Literal["roman", "italic"]
+    underline: bool
+    overstrike: bool
+
+
+class _FontPool:
+    """
+    Pool of shared fonts
+
+    All texts with the same font options share one `tkinter.font.Font`. Each
+    `acquire` of a key must be paired with a `release`, and the font is dropped
+    once nothing uses it. The sizes in the keys are the initial sizes, and the
+    actual size of every font is scaled by the zoom ratio of the pool.
+    """
+
+    def __init__(self) -> None:
+        self._fonts: dict[_FontKey, tkinter.font.Font] = {}
+        self._refs: dict[_FontKey, int] = {}
+        self._ratio: float = 1
+
+    @staticmethod
+    def key(
+        family: str | None = None,
+        size: int | None = None,
+        weight: typing.Literal["normal", "bold"] = "normal",
+        slant: typing.Literal["roman", "italic"] = "roman",
+        underline: bool = False,
+        overstrike: bool = False,
+    ) -> _FontKey:
+        """
+        Return the normalized key of the font options
+
+        * `family`: font family, default is `constants.FONT`
+        * `size`: font size, default is `constants.SIZE`
+        * `weight`: weight of the font
+        * `slant`: slant of the font
+        * `underline`: wether text is underline
+        * `overstrike`: wether text is overstrike
+        """
+        return _FontKey(family if family else constants.FONT,
+                        -abs(size if size else constants.SIZE),
+                        weight, slant, bool(underline), bool(overstrike))
+
+    def acquire(self, key: _FontKey) -> tkinter.font.Font:
+        """
+        Return the shared font of the key and add a reference to it
+
+        * `key`: the key of the font
+        """
+        if (font := self._fonts.get(key)) is None:
+            font = self._fonts[key] = tkinter.font.Font(
+                family=key.family, size=round(key.size*self._ratio),
+                weight=key.weight, slant=key.slant,
+                underline=key.underline, overstrike=key.overstrike)
+            self._refs[key] = 0
+        self._refs[key] += 1
+        return font
+
+    def release(self, key: _FontKey) -> None:
+        """
+        Remove a reference to the font of the key, and drop the font when it
+        is no longer referenced
+
+        * `key`: the key of the font
+        """
+        if (refs := self._refs.get(key)) is None:
+            return
+        if refs > 1:
+            self._refs[key] = refs - 1
+            return
+        del self._refs[key], self._fonts[key]
+
+    def actual(self, key: _FontKey) -> _FontKey:
+        """
+        Return the key with the actual size of the font, i.e. after zooming
+
+        * `key`: the key of the font
+        """
+        return key._replace(size=round(key.size*self._ratio))
+
+    def zoom(self, ratio: float) -> None:
+        """
+        Scale all fonts in the pool relative to their initial sizes
+
+        * `ratio`: the zoom ratio of the font sizes
+        """
+        if ratio == self._ratio:
+            return
+        self._ratio = ratio
+        for key, font in self._fonts.items():
+            font.config(size=round(key.size*ratio))
+
+    def clear(self) -> None:
+        """Drop all fonts"""
+        self._fonts.clear()
+        self._refs.clear()
+
+
+class _TextMetrics:
+    """
+    Measurement service of texts
+
+    Widths are kept in a LRU cache keyed by the font key and the string, and
+    short strings are measured glyph by glyph so that strings made of the
+    same glyphs need no further measurement. Once the cache is warm, measuring
+    a text costs no round trip to Tk. Texts of full-width CJK characters only
+    need the width of one representative glyph per font.
+    """
+
+    _instances: weakref.WeakKeyDictionary[tkinter.Misc, "_TextMetrics"] = \
+        weakref.WeakKeyDictionary()
+
+    def __init__(
+        self,
+        root: tkinter.Misc,
+        *,
+        maxsize: int = 4096,
+        glyphs: int = 16,
+    ) -> None:
+        """
+        * `root`: the root window that the fonts belong to
+        * `maxsize`: the maximum number of cached widths
+        * `glyphs`: strings up to this length are measured glyph by glyph
+        """
+        self._root = weakref.ref(root)  # Not to keep the key of _instances alive
+        self._maxsize = maxsize
+        self._glyphs = glyphs
+        self._fonts: dict[_FontKey, tkinter.font.Font] = {}
+        self._widths: collections.OrderedDict[
+            tuple[_FontKey, str], int] = collections.OrderedDict()
+        self._linespaces: dict[_FontKey, int] = {}
+        self._full_widths: dict[_FontKey, int] = {}
+
+    @classmethod
+    def get(cls, root: tkinter.Misc | None = None) -> "_TextMetrics":
+        """
+        Return the measurement service of the root window
+
+        * `root`: the root window, default is the default root window
+        """
+        if root is None:
+            root = tkinter._get_default_root("measure text")
+        if (metrics := cls._instances.get(root)) is None:
+            metrics = cls._instances[root] = cls(root)
+        return metrics
+
+    def _font(self, key: _FontKey) -> tkinter.font.Font:
+        """Return the font used to measure texts of the key"""
+        if (font := self._fonts.get(key)) is None:
+            font = self._fonts[key] = tkinter.font.Font(
+                self._root(), family=key.family, size=key.size,
+                weight=key.weight, slant=key.slant,
+                underline=key.underline, overstrike=key.overstrike)
+        return font
+
+    def _full_width(self, key: _FontKey) -> int:
+        """Return the advance of a full-width CJK character"""
+        if (width := self._full_widths.get(key)) is None:
+            width = self._full_widths[key] = self._font(key).measure("\u4e2d")
+        return width
+
+    def _width(self, key: _FontKey, text: str) -> int:
+        """Return the width of a string, measured by Tk only on a cache miss"""
+        if _FULL_WIDTH.fullmatch(text):
+            return len(text) * self._full_width(key)
+        if (width := self._widths.get((key, text))) is not None:
+            self._widths.move_to_end((key, text))
+            return width
+        width = self._widths[key, text] = self._font(key).measure(text)
+        if len(self._widths) > self._maxsize:
+            self._widths.popitem(last=False)
+        return width
+
+    def measure(self, key: _FontKey, text: str) -> int:
+        """
+        Return the width of the text in pixels
+
+        * `key`: the key of the font, the size is used as is
+        * `text`: the text
+        """
+        if len(text) > self._glyphs or _FULL_WIDTH.fullmatch(text):
+            return self._width(key, text)
+        return sum(self._width(key, glyph) for glyph in text)
+
+    def widths(self, key: _FontKey, text: str) -> list[int]:
+        """
+        Return the widths of each glyph of the text in pixels
+
+        * `key`: the key of the font, the size is used as is
+        * `text`: the text
+        """
+        return [self._width(key, glyph) for glyph in text]
+
+    def linespace(self, key: _FontKey) -> int:
+        """
+        Return the height of a line of text in pixels
+
+        * `key`: the key of the font, the size is used as is
+        """
+        if (linespace := self._linespaces.get(key)) is None:
+            linespace = self._linespaces[key] = \
+                self._font(key).metrics("linespace")
+        return linespace
+
+
 def get_hwnd(widget: tkinter.Widget) -> int:
     """Get the HWND of `tkinter.Widget`"""
     return ctypes.windll.user32.GetParent(widget.winfo_id())
@@ -201,5 +521,25 @@ def get_text_size(
     if fontsize > 0:
         warnings.warn("Font size requirement is negative.", UserWarning, 2)
 
-    width = tkinter.font.Font(family=family, size=fontsize).measure(text)
+    width = _TextMetrics.get().measure(
+        _FontKey(family, fontsize, "normal", "roman", False, False), text)
     return 2*padding + width, 2*padding - fontsize
+
+
+def get_line_height(
+    fontsize: int | None = None,
+    family: str | None = None,
+) -> int:
+    """
+    Get the height of a line of text with a special font family and font size
+
+    * `fontsize`: font size of the text
+    * `family`: font family of the text
+    """
+    if family is None:
+        family = constants.FONT
+    if fontsize is None:
+        fontsize = constants.SIZE
+
+    return _TextMetrics.get().linespace(
+        _FontKey(family, fontsize, "normal", "roman", False, False))